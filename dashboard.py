@@ -1,14 +1,74 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
+import functools
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import os
 import sys
 
+# Optional: plotly-resampler keeps huge time-series responsive by only
+# sending a downsampled view of each trace to the browser
+try:
+    from plotly_resampler import FigureResampler
+except ImportError:
+    FigureResampler = None
+
+# Optional: client-side auto-refresh avoids blocking a server thread in sleep()
+try:
+    from streamlit_autorefresh import st_autorefresh
+except ImportError:
+    st_autorefresh = None
+
+# Optional: Numba compiles the uptime aggregation to native code for very
+# long device-history windows
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Row count above which the Numba uptime aggregation is worth the call overhead
+NUMBA_UPTIME_THRESHOLD = 50_000
+
+# Optional: Datashader rasterizes very large windows into fixed-size images,
+# keeping client work O(pixels) instead of O(points)
+try:
+    import datashader as ds
+    import datashader.transfer_functions as tf
+except ImportError:
+    ds = None
+
+# Point count above which Scattergl gives way to a rasterized image
+DATASHADER_THRESHOLD = 100_000
+
+# Maximum points per trace before downsampling kicks in
+MAX_RENDERED_SAMPLES = 2000
+
+# Traffic-light icons indexed by threshold bucket (ok / warning / critical)
+STATUS_ICONS = np.array(['🟢', '🟡', '🔴'])
+
+# CSS classes for alert severities and device statuses, looked up per row
+SEVERITY_CLASS = {
+    'critical': 'alert-high',
+    'high': 'alert-high',
+    'medium': 'alert-medium',
+    'low': 'alert-low',
+}
+STATUS_CLASS = {
+    'Good': 'status-good',
+    'Warning': 'status-warning',
+    'Critical': 'status-critical',
+}
+
+def status_icon(value, thresholds=(70, 85)):
+    """Pick the traffic-light icon for a metric via a branchless threshold lookup"""
+    return STATUS_ICONS[np.searchsorted(np.asarray(thresholds), value, side='right')]
+
 # Add the src directory to Python path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
@@ -25,7 +85,7 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown("""
+_CSS = """
 <style>
     .metric-card {
         background-color: #f0f2f6;
@@ -58,29 +118,65 @@ st.markdown("""
         font-weight: bold;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+@st.cache_resource
+def _inject_css():
+    """Emit the style block once; Streamlit replays it on cached reruns"""
+    st.markdown(_CSS, unsafe_allow_html=True)
+    return True
+
+@st.cache_resource
+def get_data_logger():
+    """Shared DataLogger instance, reused across reruns and sessions"""
+    return DataLogger()
+
+@st.cache_resource
+def get_network_monitor():
+    """Shared NetworkMonitor instance, keeps bandwidth baselines between reruns"""
+    return NetworkMonitor()
 
 @st.cache_data(ttl=30)  # Cache for 30 seconds
 def load_data(hours=24):
-    """Load monitoring data with caching"""
+    """Load monitoring data as DataFrames with caching"""
     try:
-        data_logger = DataLogger()
-        
-        network_data = data_logger.get_network_history(hours)
-        system_data = data_logger.get_system_history(hours)
-        device_data = data_logger.get_device_history(hours=hours)
-        alert_data = data_logger.get_alert_history(hours)
-        
-        return network_data, system_data, device_data, alert_data
+        data_logger = get_data_logger()
+
+        # The four history reads are independent and I/O-bound, so overlap
+        # them; each projects only the columns its charts actually use
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            network_future = executor.submit(
+                data_logger.get_network_history_df, hours,
+                columns=['timestamp', 'upload_mbps', 'download_mbps']
+            )
+            system_future = executor.submit(
+                data_logger.get_system_history_df, hours,
+                columns=['timestamp', 'cpu_percent', 'memory_percent', 'disk_percent']
+            )
+            device_future = executor.submit(
+                data_logger.get_device_history_df, hours=hours,
+                columns=['timestamp', 'ip_address', 'is_reachable', 'response_time']
+            )
+            alert_future = executor.submit(
+                data_logger.get_alert_history_df, hours,
+                columns=['timestamp', 'alert_type', 'message', 'severity']
+            )
+
+            return (
+                network_future.result(),
+                system_future.result(),
+                device_future.result(),
+                alert_future.result()
+            )
     except Exception as e:
         st.error(f"Error loading data: {e}")
-        return [], [], [], []
+        return pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
 
 @st.cache_data(ttl=10)  # Cache for 10 seconds
 def get_current_stats():
     """Get current system statistics"""
     try:
-        monitor = NetworkMonitor()
+        monitor = get_network_monitor()
         stats = monitor.get_system_stats()
         network_stats = monitor.get_network_stats()
         upload_mbps, download_mbps = monitor.calculate_bandwidth_usage(network_stats)
@@ -101,15 +197,23 @@ def create_gauge_chart(value, title, max_value=100, color_threshold=None):
     """Create a gauge chart for metrics"""
     if color_threshold is None:
         color_threshold = [70, 85]
-    
+
+    # Quantize to one decimal so unchanged ticks reuse the memoized figure
+    return _build_gauge_chart(
+        round(value, 1), title, max_value, color_threshold[0], color_threshold[1]
+    )
+
+@functools.lru_cache(maxsize=512)
+def _build_gauge_chart(value, title, max_value, threshold_low, threshold_high):
+    """Build a gauge figure; memoized since only the quantized value changes"""
     # Determine color based on value
-    if value <= color_threshold[0]:
+    if value <= threshold_low:
         color = "green"
-    elif value <= color_threshold[1]:
+    elif value <= threshold_high:
         color = "yellow"
     else:
         color = "red"
-    
+
     fig = go.Figure(go.Indicator(
         mode="gauge+number+delta",
         value=value,
@@ -119,13 +223,13 @@ def create_gauge_chart(value, title, max_value=100, color_threshold=None):
             'axis': {'range': [None, max_value]},
             'bar': {'color': color},
             'steps': [
-                {'range': [0, color_threshold[0]], 'color': "lightgray"},
-                {'range': [color_threshold[0], color_threshold[1]], 'color': "gray"}
+                {'range': [0, threshold_low], 'color': "lightgray"},
+                {'range': [threshold_low, threshold_high], 'color': "gray"}
             ],
             'threshold': {
                 'line': {'color': "red", 'width': 4},
                 'thickness': 0.75,
-                'value': color_threshold[1]
+                'value': threshold_high
             }
         }
     ))
@@ -133,14 +237,76 @@ def create_gauge_chart(value, title, max_value=100, color_threshold=None):
     fig.update_layout(height=250, margin=dict(l=20, r=20, t=40, b=20))
     return fig
 
-def create_bandwidth_chart(network_data):
+if numba is not None:
+    @numba.njit(cache=True)
+    def _uptime_agg(group_ids, reachable, response_times, n_groups):
+        """Single-pass per-device totals, reachable counts and response-time sums"""
+        totals = np.zeros(n_groups, np.int64)
+        successes = np.zeros(n_groups, np.int64)
+        rt_sums = np.zeros(n_groups, np.float64)
+        rt_counts = np.zeros(n_groups, np.int64)
+
+        for i in range(group_ids.size):
+            g = group_ids[i]
+            totals[g] += 1
+            successes[g] += reachable[i]
+            rt = response_times[i]
+            if not np.isnan(rt):
+                rt_sums[g] += rt
+                rt_counts[g] += 1
+
+        return totals, successes, rt_sums, rt_counts
+
+def _resample_figure(fig, n_points):
+    """Wrap large figures with FigureResampler so only ~2k points are rendered"""
+    if FigureResampler is not None and n_points > MAX_RENDERED_SAMPLES:
+        return FigureResampler(fig, default_n_shown_samples=MAX_RENDERED_SAMPLES)
+    return fig
+
+def _rasterize_line(df, y_col, width=800, height=300):
+    """Render one time-series to an RGBA image with Datashader"""
+    source = df[['timestamp', y_col]].copy()
+    source['ts'] = source['timestamp'].astype('int64')
+
+    canvas = ds.Canvas(plot_width=width, plot_height=height)
+    agg = canvas.line(source, 'ts', y_col)
+
+    return np.array(tf.shade(agg).to_pil())
+
+def _create_bandwidth_raster(df):
+    """Rasterized bandwidth chart for windows too large for Scattergl"""
+    fig = make_subplots(
+        rows=2, cols=1,
+        subplot_titles=('Upload Speed', 'Download Speed'),
+        vertical_spacing=0.1
+    )
+
+    for row, y_col in ((1, 'upload_mbps'), (2, 'download_mbps')):
+        fig.add_trace(
+            go.Image(z=_rasterize_line(df, y_col), colormodel='rgba'),
+            row=row, col=1
+        )
+
+    fig.update_layout(
+        height=400,
+        title_text="Network Bandwidth Usage",
+        showlegend=False,
+        uirevision='keep'
+    )
+    fig.update_xaxes(showticklabels=False)
+    fig.update_yaxes(showticklabels=False)
+
+    return fig
+
+def create_bandwidth_chart(df):
     """Create bandwidth usage chart"""
-    if not network_data:
+    if df.empty:
         return go.Figure()
-    
-    df = pd.DataFrame(network_data)
-    df['timestamp'] = pd.to_datetime(df['timestamp'])
-    
+
+    # Very large windows get rasterized instead of shipped point-by-point
+    if ds is not None and len(df) > DATASHADER_THRESHOLD:
+        return _create_bandwidth_raster(df)
+
     fig = make_subplots(
         rows=2, cols=1,
         subplot_titles=('Upload Speed', 'Download Speed'),
@@ -149,7 +315,7 @@ def create_bandwidth_chart(network_data):
     
     # Upload speed
     fig.add_trace(
-        go.Scatter(
+        go.Scattergl(
             x=df['timestamp'],
             y=df['upload_mbps'],
             mode='lines',
@@ -162,7 +328,7 @@ def create_bandwidth_chart(network_data):
     
     # Download speed
     fig.add_trace(
-        go.Scatter(
+        go.Scattergl(
             x=df['timestamp'],
             y=df['download_mbps'],
             mode='lines',
@@ -176,26 +342,24 @@ def create_bandwidth_chart(network_data):
     fig.update_layout(
         height=400,
         title_text="Network Bandwidth Usage",
-        showlegend=False
+        showlegend=False,
+        uirevision='keep'  # preserve zoom/pan across reruns
     )
     
     fig.update_xaxes(title_text="Time")
     fig.update_yaxes(title_text="Mbps", row=1, col=1)
     fig.update_yaxes(title_text="Mbps", row=2, col=1)
-    
-    return fig
 
-def create_system_metrics_chart(system_data):
+    return _resample_figure(fig, len(df))
+
+def create_system_metrics_chart(df):
     """Create system metrics chart"""
-    if not system_data:
+    if df.empty:
         return go.Figure()
-    
-    df = pd.DataFrame(system_data)
-    df['timestamp'] = pd.to_datetime(df['timestamp'])
-    
+
     fig = go.Figure()
     
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=df['timestamp'],
         y=df['cpu_percent'],
         mode='lines',
@@ -203,7 +367,7 @@ def create_system_metrics_chart(system_data):
         line=dict(color='#1f77b4')
     ))
     
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=df['timestamp'],
         y=df['memory_percent'],
         mode='lines',
@@ -211,7 +375,7 @@ def create_system_metrics_chart(system_data):
         line=dict(color='#ff7f0e')
     ))
     
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=df['timestamp'],
         y=df['disk_percent'],
         mode='lines',
@@ -224,38 +388,55 @@ def create_system_metrics_chart(system_data):
         xaxis_title="Time",
         yaxis_title="Percentage",
         height=400,
-        legend=dict(x=0, y=1)
+        legend=dict(x=0, y=1),
+        uirevision='keep'  # preserve zoom/pan across reruns
     )
-    
-    return fig
 
-def create_device_status_chart(device_data):
+    return _resample_figure(fig, len(df))
+
+def create_device_status_chart(df):
     """Create device status chart"""
-    if not device_data:
+    if df.empty:
         return go.Figure(), pd.DataFrame()
-    
-    df = pd.DataFrame(device_data)
-    df['timestamp'] = pd.to_datetime(df['timestamp'])
-    
-    # Calculate uptime percentage for each device
-    uptime_stats = []
-    for device in df['ip_address'].unique():
-        device_df = df[df['ip_address'] == device]
-        total_checks = len(device_df)
-        successful_checks = len(device_df[device_df['is_reachable'] == True])
-        uptime_percent = (successful_checks / total_checks * 100) if total_checks > 0 else 0
-        
-        avg_response_time = device_df[device_df['response_time'].notna()]['response_time'].mean()
-        
-        uptime_stats.append({
-            'device': device,
-            'uptime_percent': uptime_percent,
-            'avg_response_time': avg_response_time,
-            'total_checks': total_checks,
-            'status': 'Good' if uptime_percent >= 95 else 'Warning' if uptime_percent >= 90 else 'Critical'
+
+    # Calculate uptime percentage for each device in a single pass
+    if numba is not None and len(df) > NUMBA_UPTIME_THRESHOLD:
+        # Native-code path for very long windows
+        group_ids, devices = pd.factorize(df['ip_address'], sort=False)
+        totals, successes, rt_sums, rt_counts = _uptime_agg(
+            group_ids.astype(np.int64),
+            df['is_reachable'].to_numpy(np.int8),
+            df['response_time'].to_numpy(np.float64),
+            len(devices)
+        )
+
+        uptime_df = pd.DataFrame({
+            'device': devices,
+            'uptime_percent': successes / totals * 100,
+            'avg_response_time': np.divide(
+                rt_sums, rt_counts,
+                out=np.full(len(devices), np.nan), where=rt_counts > 0
+            ),
+            'total_checks': totals
         })
-    
-    uptime_df = pd.DataFrame(uptime_stats)
+    else:
+        df['is_reachable'] = df['is_reachable'].astype('int8')
+        grp = df.groupby('ip_address', sort=False)
+        agg = grp['is_reachable'].agg(total_checks='size', successful_checks='sum')
+        agg['avg_response_time'] = grp['response_time'].mean()
+        agg['uptime_percent'] = agg['successful_checks'] / agg['total_checks'] * 100
+
+        uptime_df = (
+            agg.reset_index()
+            .rename(columns={'ip_address': 'device'})
+            [['device', 'uptime_percent', 'avg_response_time', 'total_checks']]
+        )
+
+    uptime_df['status'] = np.select(
+        [uptime_df['uptime_percent'] >= 95, uptime_df['uptime_percent'] >= 90],
+        ['Good', 'Warning'],
+        default='Critical'
+    )
     
     if not uptime_df.empty:
         fig = px.bar(
@@ -273,48 +454,46 @@ def create_device_status_chart(device_data):
     
     return fig, uptime_df
 
-def display_alerts(alert_data):
+def display_alerts(alerts_df):
     """Display recent alerts"""
-    if not alert_data:
+    if alerts_df.empty:
         st.success("✅ No recent alerts")
         return
-    
+
     # Sort alerts by timestamp (most recent first)
-    alerts_df = pd.DataFrame(alert_data)
-    alerts_df['timestamp'] = pd.to_datetime(alerts_df['timestamp'])
     alerts_df = alerts_df.sort_values('timestamp', ascending=False)
     
     st.subheader(f"🚨 Recent Alerts ({len(alerts_df)})")
     
-    # Group alerts by severity
-    severity_counts = alerts_df['severity'].value_counts()
-    
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        st.metric("Critical", severity_counts.get('critical', 0))
-    with col2:
-        st.metric("High", severity_counts.get('high', 0))
-    with col3:
-        st.metric("Medium", severity_counts.get('medium', 0))
-    with col4:
-        st.metric("Low", severity_counts.get('low', 0))
-    
-    # Display recent alerts
-    for _, alert in alerts_df.head(10).iterrows():
-        severity_class = f"alert-{alert['severity']}" if alert['severity'] in ['high', 'medium', 'low'] else "alert-high"
-        
-        with st.container():
-            st.markdown(f"""
-            <div class="metric-card {severity_class}">
-                <strong>{alert['alert_type']}</strong> - {alert['severity'].upper()}<br>
-                <small>{alert['timestamp'].strftime('%Y-%m-%d %H:%M:%S')}</small><br>
-                {alert['message']}
-            </div>
-            """, unsafe_allow_html=True)
-            st.write("")
+    # Group alerts by severity, counted once in a fixed display order
+    severity_counts = (
+        alerts_df['severity']
+        .value_counts()
+        .reindex(['critical', 'high', 'medium', 'low'], fill_value=0)
+    )
+
+    for col, (severity, count) in zip(st.columns(4), severity_counts.items()):
+        col.metric(severity.title(), int(count))
+    
+    # Display recent alerts as one batched markdown block (single component update)
+    alert_cards = []
+    recent = alerts_df.head(10)[['alert_type', 'severity', 'timestamp', 'message']]
+    for alert_type, severity, timestamp, message in recent.itertuples(index=False, name=None):
+        severity_class = SEVERITY_CLASS.get(severity, 'alert-high')
+
+        alert_cards.append(f"""
+        <div class="metric-card {severity_class}" style="margin-bottom: 0.5rem;">
+            <strong>{alert_type}</strong> - {severity.upper()}<br>
+            <small>{timestamp.strftime('%Y-%m-%d %H:%M:%S')}</small><br>
+            {message}
+        </div>
+        """)
+
+    st.markdown("\n".join(alert_cards), unsafe_allow_html=True)
 
 def main():
     """Main dashboard function"""
+    _inject_css()
     st.title("🌐 Network Monitoring Dashboard")
     
     # Sidebar configuration
@@ -331,9 +510,11 @@ def main():
     # Auto-refresh toggle
     auto_refresh = st.sidebar.checkbox("Auto Refresh (30s)", value=True)
     
-    # Manual refresh button
+    # Manual refresh button — clear only the data loaders, keep derived
+    # figures and other memoized values warm
     if st.sidebar.button("🔄 Refresh Now"):
-        st.cache_data.clear()
+        load_data.clear()
+        get_current_stats.clear()
         st.rerun()
     
     # Current status section
@@ -345,21 +526,21 @@ def main():
         col1, col2, col3, col4, col5 = st.columns(5)
         
         with col1:
-            cpu_color = "🟢" if current_stats['cpu_percent'] < 70 else "🟡" if current_stats['cpu_percent'] < 85 else "🔴"
+            cpu_color = status_icon(current_stats['cpu_percent'])
             st.metric(
                 f"{cpu_color} CPU Usage",
                 f"{current_stats['cpu_percent']:.1f}%"
             )
-        
+
         with col2:
-            mem_color = "🟢" if current_stats['memory_percent'] < 70 else "🟡" if current_stats['memory_percent'] < 85 else "🔴"
+            mem_color = status_icon(current_stats['memory_percent'])
             st.metric(
                 f"{mem_color} Memory Usage",
                 f"{current_stats['memory_percent']:.1f}%"
             )
-        
+
         with col3:
-            disk_color = "🟢" if current_stats['disk_percent'] < 80 else "🟡" if current_stats['disk_percent'] < 90 else "🔴"
+            disk_color = status_icon(current_stats['disk_percent'], thresholds=(80, 90))
             st.metric(
                 f"{disk_color} Disk Usage",
                 f"{current_stats['disk_percent']:.1f}%"
@@ -405,22 +586,22 @@ def main():
             )
             st.plotly_chart(disk_gauge, use_container_width=True)
     
-    # Load historical data
-    network_data, system_data, device_data, alert_data = load_data(time_range)
-    
+    # Load historical data, already windowed and parsed in the query layer
+    network_df, system_df, device_df_raw, alerts_df = load_data(time_range)
+
     # Network bandwidth charts
     st.header("🌐 Network Bandwidth")
-    bandwidth_chart = create_bandwidth_chart(network_data)
+    bandwidth_chart = create_bandwidth_chart(network_df)
     st.plotly_chart(bandwidth_chart, use_container_width=True)
-    
+
     # System metrics over time
     st.header("💻 System Performance")
-    system_chart = create_system_metrics_chart(system_data)
+    system_chart = create_system_metrics_chart(system_df)
     st.plotly_chart(system_chart, use_container_width=True)
-    
+
     # Device monitoring
     st.header("📱 Device Monitoring")
-    device_chart, device_df = create_device_status_chart(device_data)
+    device_chart, device_df = create_device_status_chart(device_df_raw)
     
     if not device_df.empty:
         col1, col2 = st.columns([2, 1])
@@ -430,46 +611,52 @@ def main():
         
         with col2:
             st.subheader("Device Status")
-            for _, device in device_df.iterrows():
-                status_class = "status-good" if device['status'] == 'Good' else "status-warning" if device['status'] == 'Warning' else "status-critical"
-                
-                st.markdown(f"""
-                <div class="metric-card">
-                    <strong>{device['device']}</strong><br>
-                    <span class="{status_class}">{device['status']}</span><br>
-                    Uptime: {device['uptime_percent']:.1f}%<br>
-                    Avg Response: {device['avg_response_time']:.1f}ms
+            device_cards = []
+            device_rows = device_df[['device', 'uptime_percent', 'avg_response_time', 'status']]
+            for name, uptime, avg_rt, status in device_rows.itertuples(index=False, name=None):
+                status_class = STATUS_CLASS.get(status, 'status-critical')
+
+                device_cards.append(f"""
+                <div class="metric-card" style="margin-bottom: 0.5rem;">
+                    <strong>{name}</strong><br>
+                    <span class="{status_class}">{status}</span><br>
+                    Uptime: {uptime:.1f}%<br>
+                    Avg Response: {avg_rt:.1f}ms
                 </div>
-                """, unsafe_allow_html=True)
-                st.write("")
+                """)
+
+            st.markdown("\n".join(device_cards), unsafe_allow_html=True)
     else:
         st.info("No device monitoring data available")
     
     # Alerts section
     st.header("🚨 Alerts")
-    display_alerts(alert_data)
+    display_alerts(alerts_df)
     
     # Data summary
     with st.expander("📊 Data Summary"):
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            st.metric("Network Records", len(network_data))
+            st.metric("Network Records", len(network_df))
         with col2:
-            st.metric("System Records", len(system_data))
+            st.metric("System Records", len(system_df))
         with col3:
-            st.metric("Device Records", len(device_data))
+            st.metric("Device Records", len(device_df_raw))
         with col4:
-            st.metric("Alert Records", len(alert_data))
+            st.metric("Alert Records", len(alerts_df))
     
     # Footer with last update time
     st.markdown("---")
     st.caption(f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
-    # Auto-refresh functionality
+    # Auto-refresh functionality (client-side reload, no blocked server thread)
     if auto_refresh:
-        time.sleep(30)
-        st.rerun()
+        if st_autorefresh is not None:
+            st_autorefresh(interval=30 * 1000, key='auto_refresh')
+        else:
+            time.sleep(30)
+            st.rerun()
 
 if __name__ == "__main__":
     try:
@@ -4,11 +4,18 @@ Network Monitoring and Alert System
 Main application file
 """
 
+import heapq
+import os
+import queue
+import random
 import time
 import threading
 import signal
 import sys
 import logging
+import numpy as np
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List
 
@@ -17,6 +24,19 @@ from src.network_monitor import NetworkMonitor
 from src.alert_manager import AlertManager
 from src.data_logger import DataLogger
 
+# Optional: icmplib probes all devices from one process with raw/datagram
+# ICMP sockets, avoiding a fork/exec of the ping binary per target
+try:
+    import icmplib
+except ImportError:
+    icmplib = None
+
+# Touched once the scheduler is running; the dashboard launcher polls
+# for it instead of sleeping a fixed delay. Relative like the rest of
+# the data/ artifacts — the launcher starts us with cwd set to the
+# repository directory.
+READY_FILE = os.path.join('data', 'monitor.ready')
+
 class NetworkMonitoringSystem:
     """Main network monitoring system orchestrator"""
     
@@ -50,8 +70,14 @@ class NetworkMonitoringSystem:
                 smtp_port=Config.SMTP_PORT,
                 email_user=Config.EMAIL_USER or "demo@example.com",
                 email_password=Config.EMAIL_PASSWORD or "demo_password",
-                recipients=Config.ALERT_RECIPIENTS if Config.ALERT_RECIPIENTS != [''] else ["demo@example.com"],
-                cooldown_minutes=Config.ALERT_COOLDOWN_MINUTES
+                recipients=Config.ALERT_RECIPIENTS or ("demo@example.com",),
+                cooldown_minutes=Config.ALERT_COOLDOWN_MINUTES,
+                use_ssl=Config.SMTP_USE_SSL,
+                thresholds={
+                    'cpu': Config.CPU_THRESHOLD_PERCENT,
+                    'memory': Config.MEMORY_THRESHOLD_PERCENT,
+                    'disk': Config.DISK_THRESHOLD_PERCENT
+                }
             )
         except Exception as e:
             self.logger.warning(f"⚠️ Alert manager initialization warning: {e}")
@@ -62,6 +88,48 @@ class NetworkMonitoringSystem:
         # Control flags
         self.running = False
         self.threads = []
+        self._stop_event = threading.Event()
+
+        # Rolling in-memory stats so status printing needs no disk reads
+        self._recent_upload = deque(maxlen=10)
+        self._recent_download = deque(maxlen=10)
+        self._last_system_stats = None
+
+        # Token buckets so repeating warnings log once a minute per key
+        # instead of flooding the log during a sustained outage
+        self._log_bucket = {}
+
+        # Delta-gate state for disk logging: last written (time, value) per
+        # data stream, so steady-state samples are not rewritten every tick
+        self._last_logged = {}
+
+        # Alerts from all monitor tasks funnel through one queue so a single
+        # mailer thread can amortize the SMTP session across messages.
+        # SimpleQueue puts are C-level and reentrant, so producers never
+        # contend on a Python-side lock in the monitor hot path
+        self._alert_queue = queue.SimpleQueue()
+
+        # Bind per-tick Config reads once; these are runtime-constant and the
+        # instance attribute avoids repeated class-attribute resolution in
+        # the hot monitor paths
+        self._bandwidth_threshold = Config.BANDWIDTH_THRESHOLD_MBPS
+        self._ping_timeout = Config.PING_TIMEOUT_SECONDS
+
+        # System alert thresholds are runtime-constant; build the dict once
+        self._system_thresholds = {
+            'cpu': Config.CPU_THRESHOLD_PERCENT,
+            'memory': Config.MEMORY_THRESHOLD_PERCENT,
+            'disk': Config.DISK_THRESHOLD_PERCENT
+        }
+
+        # Config already parses the device list into a cleaned tuple
+        self._device_ips = Config.MONITORED_DEVICES
+
+        # Persistent pool so device pings run concurrently instead of serially
+        self._ping_pool = ThreadPoolExecutor(
+            max_workers=min(32, max(1, len(self._device_ips))),
+            thread_name_prefix="ping"
+        )
         
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -81,20 +149,29 @@ class NetworkMonitoringSystem:
             return
         
         self.running = True
+        self._stop_event.clear()
         self.logger.info("🔄 Starting Network Monitoring System...")
-        
-        # Start monitoring threads
-        self._start_network_monitoring()
-        self._start_system_monitoring()
-        self._start_device_monitoring()
-        
-        self.logger.info("✅ All monitoring threads started")
-        
-        # Main loop
+
+        # Start the scheduler thread that drives all monitoring tasks
+        self._start_scheduler()
+        self._start_mailer()
+
+        self.logger.info("✅ Monitoring scheduler started")
+
+        # Signal readiness to the launcher
         try:
-            while self.running:
+            with open(READY_FILE, 'w'):
+                pass
+        except OSError as e:
+            self.logger.warning(f"⚠️ Could not write ready file: {e}")
+
+        # Main loop (status update every minute, drift-free)
+        try:
+            next_deadline = time.monotonic()
+            while not self._stop_event.is_set():
                 self._print_status()
-                time.sleep(60)  # Status update every minute
+                next_deadline += 60
+                self._stop_event.wait(timeout=max(0, next_deadline - time.monotonic()))
         except KeyboardInterrupt:
             self.logger.info("👋 Received keyboard interrupt")
         finally:
@@ -107,183 +184,295 @@ class NetworkMonitoringSystem:
         
         self.logger.info("🛑 Stopping Network Monitoring System...")
         self.running = False
-        
-        # Wait for threads to finish
+        self._stop_event.set()  # Wake any thread sleeping between intervals
+
+        # Threads wake from Event.wait as soon as the stop event is set, so a
+        # short join suffices and shutdown stays near-instant even with
+        # several threads
         for thread in self.threads:
             if thread.is_alive():
                 self.logger.info(f"⏳ Waiting for {thread.name} to finish...")
-                thread.join(timeout=5)
-        
+                thread.join(timeout=1)
+
+        self._ping_pool.shutdown(wait=False)
+
+        try:
+            os.remove(READY_FILE)
+        except OSError:
+            pass
+
         self.logger.info("✅ Network Monitoring System stopped")
     
-    def _start_network_monitoring(self):
-        """Start network monitoring thread"""
-        def monitor_network():
-            self.logger.info("🌐 Starting network monitoring thread")
-            
-            while self.running:
+    def _rate_warn(self, key: str, message: str, period: float = 60.0):
+        """Log a warning at most once per period per key, counting suppressions"""
+        now = time.monotonic()
+        last, suppressed = self._log_bucket.get(key, (0.0, 0))
+
+        if now - last >= period:
+            self.logger.warning(f"{message} (x{suppressed + 1})" if suppressed else message)
+            self._log_bucket[key] = (now, 0)
+        else:
+            self._log_bucket[key] = (last, suppressed + 1)
+
+    def _should_log(self, key: str, value, interval: float, eps: float = 1.0) -> bool:
+        """Delta-gate disk logging for one data stream
+
+        Returns True (and records the sample) when any component of `value`
+        moved more than `eps` since the last write, or when 5x the check
+        interval has passed without one — so charts keep a sparse baseline
+        while steady-state ticks skip the JSON load/dump entirely.
+        """
+        now = time.monotonic()
+        last = self._last_logged.get(key)
+
+        if last is not None:
+            last_ts, last_value = last
+            if now - last_ts < 5 * interval and not any(
+                    abs(a - b) > eps for a, b in zip(value, last_value)):
+                return False
+
+        self._last_logged[key] = (now, value)
+        return True
+
+    def _start_scheduler(self):
+        """Start the single scheduler thread that drives all monitoring tasks"""
+        def run_scheduler():
+            self.logger.info("⏱️ Starting monitoring scheduler thread")
+
+            now = time.monotonic()
+            schedule = [
+                (now, 0, Config.NETWORK_CHECK_INTERVAL, self._run_network_check),
+                (now, 1, Config.SYSTEM_CHECK_INTERVAL, self._run_system_check),
+                (now, 2, Config.DEVICE_PING_INTERVAL, self._run_device_check),
+            ]
+            heapq.heapify(schedule)
+
+            # Per-task retry delays: doubled (with jitter) on repeated
+            # failures so a persistent fault cannot hammer the log, reset
+            # to 10s on success
+            backoffs = {}
+
+            while not self._stop_event.is_set():
+                due, order, interval, task = heapq.heappop(schedule)
+
+                # Sleep until the earliest task is due (or shutdown is requested)
+                if self._stop_event.wait(timeout=max(0, due - time.monotonic())):
+                    break
+
                 try:
-                    # Get network statistics
-                    network_stats = self.network_monitor.get_network_stats()
-                    upload_mbps, download_mbps = self.network_monitor.calculate_bandwidth_usage(network_stats)
-                    
-                    # Detect anomalies
-                    anomalies = self.network_monitor.detect_anomalies(
-                        upload_mbps, download_mbps, Config.BANDWIDTH_THRESHOLD_MBPS
-                    )
-                    
-                    # Log data
-                    self.data_logger.log_network_data(
-                        upload_mbps, download_mbps, network_stats, anomalies
-                    )
-                    
-                    # Process alerts
-                    alerts = []
-                    if self.alert_manager:
-                        alerts = self.alert_manager.process_network_alerts(
-                            upload_mbps, download_mbps, anomalies, Config.BANDWIDTH_THRESHOLD_MBPS
-                        )
-                        
-                        if alerts:
-                            self.data_logger.log_alert_data(alerts)
-                            result = self.alert_manager.send_all_alerts(alerts)
-                            if result['failed'] > 0:
-                                self.logger.warning(f"⚠️ Failed to send {result['failed']} alerts")
-                    
-                    # Log anomalies even without alert manager
-                    if anomalies:
-                        for anomaly in anomalies:
-                            self.logger.warning(f"🚨 Network anomaly: {anomaly}")
-                    
-                    # Log current status
-                    if upload_mbps > 1 or download_mbps > 1:  # Only log significant traffic
-                        self.logger.info(
-                            f"📊 Network: ↑{upload_mbps:.2f} Mbps ↓{download_mbps:.2f} Mbps"
-                        )
-                    
-                    time.sleep(Config.NETWORK_CHECK_INTERVAL)
-                    
+                    task()
+                    backoffs[task] = 10.0
+                    next_due = due + interval
                 except Exception as e:
-                    self.logger.error(f"❌ Error in network monitoring: {e}")
-                    time.sleep(10)  # Short delay before retry
-        
-        thread = threading.Thread(target=monitor_network, name="NetworkMonitor", daemon=True)
+                    delay = backoffs.get(task, 10.0)
+                    self.logger.error(f"❌ Error in {task.__name__} (retry in {delay:.0f}s): {e}")
+                    next_due = time.monotonic() + delay
+                    backoffs[task] = min(300.0, delay * 2 + random.uniform(0, 1))
+
+                heapq.heappush(schedule, (next_due, order, interval, task))
+
+        thread = threading.Thread(target=run_scheduler, name="MonitorScheduler", daemon=True)
         thread.start()
         self.threads.append(thread)
-    
-    def _start_system_monitoring(self):
-        """Start system monitoring thread"""
-        def monitor_system():
-            self.logger.info("💻 Starting system monitoring thread")
-            
-            while self.running:
+
+    def _start_mailer(self):
+        """Start the single mailer thread that drains the alert queue"""
+        def drain_alerts():
+            self.logger.info("📧 Starting alert mailer thread")
+
+            while True:
                 try:
-                    # Get system statistics
-                    system_stats = self.network_monitor.get_system_stats()
-                    
-                    # Log data
-                    self.data_logger.log_system_data(system_stats)
-                    
-                    # Process alerts
-                    alerts = []
-                    if self.alert_manager:
-                        thresholds = {
-                            'cpu': Config.CPU_THRESHOLD_PERCENT,
-                            'memory': Config.MEMORY_THRESHOLD_PERCENT,
-                            'disk': Config.DISK_THRESHOLD_PERCENT
-                        }
-                        
-                        alerts = self.alert_manager.process_system_alerts(system_stats, thresholds)
-                        
-                        if alerts:
-                            self.data_logger.log_alert_data(alerts)
-                            result = self.alert_manager.send_all_alerts(alerts)
-                            if result['failed'] > 0:
-                                self.logger.warning(f"⚠️ Failed to send {result['failed']} alerts")
-                    
-                    # Log threshold violations even without alert manager
-                    if system_stats.cpu_percent > Config.CPU_THRESHOLD_PERCENT:
-                        self.logger.warning(f"🚨 High CPU usage: {system_stats.cpu_percent:.1f}%")
-                    if system_stats.memory_percent > Config.MEMORY_THRESHOLD_PERCENT:
-                        self.logger.warning(f"🚨 High memory usage: {system_stats.memory_percent:.1f}%")
-                    if system_stats.disk_percent > Config.DISK_THRESHOLD_PERCENT:
-                        self.logger.warning(f"🚨 High disk usage: {system_stats.disk_percent:.1f}%")
-                    
-                    # Log current status
-                    self.logger.info(
-                        f"🖥️ System: CPU {system_stats.cpu_percent:.1f}% "
-                        f"RAM {system_stats.memory_percent:.1f}% "
-                        f"Disk {system_stats.disk_percent:.1f}%"
-                    )
-                    
-                    time.sleep(Config.SYSTEM_CHECK_INTERVAL)
-                    
-                except Exception as e:
-                    self.logger.error(f"❌ Error in system monitoring: {e}")
-                    time.sleep(10)  # Short delay before retry
-        
-        thread = threading.Thread(target=monitor_system, name="SystemMonitor", daemon=True)
-        thread.start()
-        self.threads.append(thread)
-    
-    def _start_device_monitoring(self):
-        """Start device monitoring thread"""
-        def monitor_devices():
-            self.logger.info("📱 Starting device monitoring thread")
-            
-            while self.running:
+                    batch = [self._alert_queue.get(timeout=1)]
+                except queue.Empty:
+                    if self._stop_event.is_set():
+                        break
+                    continue
+
+                # Drain whatever else arrived so one wakeup handles the
+                # whole burst back to back over the same SMTP session
+                try:
+                    while True:
+                        batch.append(self._alert_queue.get_nowait())
+                except queue.Empty:
+                    pass
+
+                # One digest email for the whole batch; per-type
+                # cooldowns are honored inside send_all_alerts
                 try:
-                    device_statuses = []
-                    
-                    # Ping all monitored devices
-                    for device_ip in Config.MONITORED_DEVICES:
-                        if device_ip.strip():  # Skip empty entries
-                            status = self.network_monitor.ping_device(
-                                device_ip.strip(), Config.PING_TIMEOUT_SECONDS
-                            )
-                            device_statuses.append(status)
-                    
-                    # Log data
-                    self.data_logger.log_device_data(device_statuses)
-                    
-                    # Process alerts
-                    alerts = []
                     if self.alert_manager:
-                        alerts = self.alert_manager.process_device_alerts(device_statuses)
-                        
-                        if alerts:
-                            self.data_logger.log_alert_data(alerts)
-                            result = self.alert_manager.send_all_alerts(alerts)
-                            if result['failed'] > 0:
-                                self.logger.warning(f"⚠️ Failed to send {result['failed']} alerts")
-                    
-                    # Log device status
-                    reachable_count = sum(1 for status in device_statuses if status.is_reachable)
-                    total_count = len(device_statuses)
-                    
-                    self.logger.info(
-                        f"📡 Devices: {reachable_count}/{total_count} reachable"
-                    )
-                    
-                    # Log individual device issues
-                    for status in device_statuses:
-                        if not status.is_reachable:
-                            self.logger.warning(f"❌ Device {status.ip_address} unreachable")
-                        elif status.response_time and status.response_time > 500:
+                        result = self.alert_manager.send_all_alerts(batch)
+                        if result['failed']:
                             self.logger.warning(
-                                f"⚠️ Device {status.ip_address} high latency: {status.response_time:.1f}ms"
-                            )
-                    
-                    time.sleep(Config.DEVICE_PING_INTERVAL)
-                    
+                                "⚠️ Failed to send %d alert(s)", result['failed'])
                 except Exception as e:
-                    self.logger.error(f"❌ Error in device monitoring: {e}")
-                    time.sleep(10)  # Short delay before retry
-        
-        thread = threading.Thread(target=monitor_devices, name="DeviceMonitor", daemon=True)
+                    self.logger.error(f"❌ Error sending alert email: {e}")
+
+        thread = threading.Thread(target=drain_alerts, name="AlertMailer", daemon=True)
         thread.start()
         self.threads.append(thread)
-    
+
+    def _run_network_check(self):
+        """Collect and process one round of network statistics"""
+        # Get network statistics
+        network_stats = self.network_monitor.get_network_stats()
+        upload_mbps, download_mbps = self.network_monitor.calculate_bandwidth_usage(network_stats)
+        self._recent_upload.append(upload_mbps)
+        self._recent_download.append(download_mbps)
+
+        # Detect anomalies
+        anomalies = self.network_monitor.detect_anomalies(
+            upload_mbps, download_mbps, self._bandwidth_threshold
+        )
+
+        # Log data (skipped while bandwidth sits still, except for anomalies)
+        if anomalies or self._should_log(
+                'network', (upload_mbps, download_mbps),
+                Config.NETWORK_CHECK_INTERVAL, eps=0.5):
+            self.data_logger.log_network_data(
+                upload_mbps, download_mbps, network_stats, anomalies
+            )
+
+        # Process alerts
+        alerts = []
+        if self.alert_manager:
+            alerts = self.alert_manager.process_network_alerts(
+                upload_mbps, download_mbps, anomalies, self._bandwidth_threshold
+            )
+
+            if alerts:
+                self.data_logger.log_alert_data(alerts)
+                for alert in alerts:
+                    self._alert_queue.put(alert)
+
+        # Log anomalies even without alert manager
+        if anomalies:
+            for anomaly in anomalies:
+                self._rate_warn(f"net_anomaly:{anomaly.split(':')[0]}",
+                                f"🚨 Network anomaly: {anomaly}")
+
+        # Log current status (%-style so formatting is skipped when filtered)
+        if upload_mbps > 1 or download_mbps > 1:  # Only log significant traffic
+            self.logger.info(
+                "📊 Network: ↑%.2f Mbps ↓%.2f Mbps", upload_mbps, download_mbps
+            )
+
+    def _run_system_check(self):
+        """Collect and process one round of system statistics"""
+        # Get system statistics
+        system_stats = self.network_monitor.get_system_stats()
+        self._last_system_stats = system_stats
+
+        # Log data (skipped while CPU/RAM/disk are within 1% of last write)
+        if self._should_log(
+                'system',
+                (system_stats.cpu_percent, system_stats.memory_percent,
+                 system_stats.disk_percent),
+                Config.SYSTEM_CHECK_INTERVAL):
+            self.data_logger.log_system_data(system_stats)
+
+        # Process alerts
+        alerts = []
+        if self.alert_manager:
+            # Thresholds were resolved once at AlertManager construction
+            alerts = self.alert_manager.process_system_alerts(system_stats)
+
+            if alerts:
+                self.data_logger.log_alert_data(alerts)
+                for alert in alerts:
+                    self._alert_queue.put(alert)
+
+        # Log threshold violations even without alert manager
+        thresholds = self._system_thresholds
+        if system_stats.cpu_percent > thresholds['cpu']:
+            self._rate_warn("high_cpu", f"🚨 High CPU usage: {system_stats.cpu_percent:.1f}%")
+        if system_stats.memory_percent > thresholds['memory']:
+            self._rate_warn("high_memory", f"🚨 High memory usage: {system_stats.memory_percent:.1f}%")
+        if system_stats.disk_percent > thresholds['disk']:
+            self._rate_warn("high_disk", f"🚨 High disk usage: {system_stats.disk_percent:.1f}%")
+
+        # Log current status (%-style so formatting is skipped when filtered)
+        self.logger.info(
+            "🖥️ System: CPU %.1f%% RAM %.1f%% Disk %.1f%%",
+            system_stats.cpu_percent, system_stats.memory_percent,
+            system_stats.disk_percent
+        )
+
+    def _ping_devices(self):
+        """Probe all monitored devices, preferring one batched ICMP sweep"""
+        if icmplib is not None:
+            # The monitor batches every probe through icmplib.multiping
+            # (and degrades internally if the sweep fails)
+            return self.network_monitor.ping_devices(
+                self._device_ips, self._ping_timeout
+            )
+
+        # Fallback: concurrent subprocess pings; each ping is pure I/O wait
+        futures = [
+            self._ping_pool.submit(
+                self.network_monitor.ping_device,
+                device_ip, self._ping_timeout
+            )
+            for device_ip in self._device_ips
+        ]
+        return [future.result() for future in futures]
+
+    def _run_device_check(self):
+        """Ping all monitored devices and process the results"""
+        device_statuses = self._ping_devices()
+
+        # Device rows are exempt from the delta gate: uptime_percent is
+        # computed as successful/total over the *logged* rows, so
+        # subsampling steady state while always writing transitions
+        # would over-weight the bad ticks and understate uptime
+        self.data_logger.log_device_data(device_statuses)
+
+        # Process alerts
+        alerts = []
+        if self.alert_manager:
+            alerts = self.alert_manager.process_device_alerts(device_statuses)
+
+            if alerts:
+                self.data_logger.log_alert_data(alerts)
+                for alert in alerts:
+                    self._alert_queue.put(alert)
+
+        # Log device status: extract the flags once, then count at C level
+        reachable_mask = [status.is_reachable for status in device_statuses]
+        reachable_count = sum(reachable_mask)
+        total_count = len(device_statuses)
+
+        self.logger.info(
+            "📡 Devices: %d/%d reachable", reachable_count, total_count
+        )
+
+        # Log individual device issues
+        for status, reachable in zip(device_statuses, reachable_mask):
+            if not reachable:
+                self._rate_warn(f"dev_unreachable:{status.ip_address}",
+                                f"❌ Device {status.ip_address} unreachable")
+
+        # High-latency scan: one vectorized comparison for larger fleets,
+        # plain loop below the ndarray setup-cost break-even
+        if total_count >= 8:
+            rtts = np.fromiter(
+                (s.response_time if s.is_reachable and s.response_time else np.nan
+                 for s in device_statuses),
+                dtype=np.float32, count=total_count
+            )
+            slow_indices = np.where(rtts > 500.0)[0]
+        else:
+            slow_indices = [
+                i for i, s in enumerate(device_statuses)
+                if reachable_mask[i] and s.response_time and s.response_time > 500
+            ]
+
+        for i in slow_indices:
+            status = device_statuses[i]
+            self._rate_warn(
+                f"dev_latency:{status.ip_address}",
+                f"⚠️ Device {status.ip_address} high latency: {status.response_time:.1f}ms"
+            )
+
     def _print_status(self):
         """Print system status summary"""
         try:
@@ -293,40 +482,42 @@ class NetworkMonitoringSystem:
             else:
                 alert_summary = {'total_alerts': 0, 'by_severity': {}}
             
-            # Get recent data
-            recent_network = self.data_logger.get_network_history(hours=1)
-            recent_system = self.data_logger.get_system_history(hours=1)
-            
-            print("\n" + "="*60)
-            print(f"📊 NETWORK MONITORING SYSTEM STATUS - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            print("="*60)
-            
+            # Compose the whole report first so it goes out in one write
+            lines = [
+                "",
+                "=" * 60,
+                f"📊 NETWORK MONITORING SYSTEM STATUS - {datetime.now().isoformat(sep=' ', timespec='seconds')}",
+                "=" * 60,
+            ]
+
             # Alert summary
             if alert_summary['total_alerts'] > 0:
-                print(f"🚨 Active Alerts: {alert_summary['total_alerts']}")
+                lines.append(f"🚨 Active Alerts: {alert_summary['total_alerts']}")
                 for severity, count in alert_summary['by_severity'].items():
-                    print(f"   {severity.upper()}: {count}")
+                    lines.append(f"   {severity.upper()}: {count}")
             else:
-                print("✅ No active alerts")
-            
-            # Network summary
-            if recent_network:
-                avg_upload = sum(r['upload_mbps'] for r in recent_network[-10:]) / min(len(recent_network), 10)
-                avg_download = sum(r['download_mbps'] for r in recent_network[-10:]) / min(len(recent_network), 10)
-                print(f"🌐 Network (avg last 10 readings): ↑{avg_upload:.2f} Mbps ↓{avg_download:.2f} Mbps")
-            
-            # System summary
-            if recent_system:
-                latest_system = recent_system[-1]
-                print(f"💻 System: CPU {latest_system['cpu_percent']:.1f}% "
-                      f"RAM {latest_system['memory_percent']:.1f}% "
-                      f"Disk {latest_system['disk_percent']:.1f}%")
-            
+                lines.append("✅ No active alerts")
+
+            # Network summary from the in-memory rolling window
+            if self._recent_upload:
+                avg_upload = sum(self._recent_upload) / len(self._recent_upload)
+                avg_download = sum(self._recent_download) / len(self._recent_download)
+                lines.append(f"🌐 Network (avg last 10 readings): ↑{avg_upload:.2f} Mbps ↓{avg_download:.2f} Mbps")
+
+            # System summary from the last collected sample
+            if self._last_system_stats:
+                lines.append(f"💻 System: CPU {self._last_system_stats.cpu_percent:.1f}% "
+                             f"RAM {self._last_system_stats.memory_percent:.1f}% "
+                             f"Disk {self._last_system_stats.disk_percent:.1f}%")
+
             # Dashboard info
             if self.dashboard_mode:
-                print("🌐 Dashboard: http://localhost:8501")
-            
-            print("="*60)
+                lines.append("🌐 Dashboard: http://localhost:8501")
+
+            lines.append("=" * 60)
+
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
             
         except Exception as e:
             self.logger.error(f"❌ Error printing status: {e}")
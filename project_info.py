@@ -8,183 +8,181 @@ import os
 import sys
 from datetime import datetime
 
+# Whole report as one template: a single buffered write instead of ~100
+# print() calls each taking the stdout lock and flushing separately
+BANNER = "🌐" + "=" * 70 + "🌐"
+
+TEMPLATE = """\
+{banner}
+   NETWORK MONITORING AND ALERT SYSTEM - PROJECT STATUS
+{banner}
+
+📊 PROJECT OVERVIEW:
+   • Real-time network monitoring with bandwidth tracking
+   • System performance monitoring (CPU, Memory, Disk)
+   • Device connectivity monitoring with ping checks
+   • Intelligent anomaly detection and alerting
+   • Interactive web dashboard with Streamlit
+   • Email notification system with SMTP integration
+
+💻 TECHNOLOGY STACK:
+   • Python 3.7+ (Core Language)
+   • psutil (System & Network Monitoring)
+   • Streamlit (Web Dashboard Framework)
+   • Plotly (Data Visualization)
+   • Pandas (Data Analysis)
+   • smtplib (Email Notifications)
+   • JSON (Data Storage)
+   • Threading (Concurrent Monitoring)
+
+🏗️ SYSTEM ARCHITECTURE:
+   ┌─────────────────────────────────────────────┐
+   │  Web Dashboard  │  Console UI  │  Email Alerts │
+   ├─────────────────────────────────────────────┤
+   │  Network Thread │ System Thread │ Device Thread │
+   ├─────────────────────────────────────────────┤
+   │  Data Logger    │ Alert Manager │ Config Mgr   │
+   ├─────────────────────────────────────────────┤
+   │           JSON Data Storage Layer           │
+   └─────────────────────────────────────────────┘
+
+📁 PROJECT STRUCTURE:
+   network/
+   ├── 🚀 main.py                 # Main monitoring application
+   ├── 📊 dashboard.py            # Streamlit web dashboard
+   ├── 🔗 start_dashboard.py      # Integrated launcher
+   ├── 🎯 quickstart.py           # Interactive menu
+   ├── 🔧 utils.py                # Command-line utilities
+   ├── 🧪 test_system.py          # System tests
+   ├── ⚙️ setup.py               # Installation script
+   ├── 📦 requirements.txt        # Dependencies
+   ├── 📋 .env.example           # Configuration template
+   ├── 📖 README.md              # Complete documentation
+   ├── 📂 src/                   # Core modules
+   │   ├── config.py             # Configuration management
+   │   ├── network_monitor.py    # Network monitoring core
+   │   ├── alert_manager.py      # Alert system
+   │   ├── data_logger.py        # Data persistence
+   │   └── packet_analyzer.py    # Advanced analysis
+   ├── 📝 logs/                  # Application logs
+   └── 💾 data/                  # Monitoring data
+
+🌟 KEY FEATURES:
+   ✅ Real-time bandwidth monitoring (Upload/Download)
+   ✅ System resource tracking (CPU/Memory/Disk)
+   ✅ Device connectivity monitoring (Ping-based)
+   ✅ Intelligent anomaly detection
+   ✅ Multi-threaded concurrent monitoring
+   ✅ SMTP email alert system
+   ✅ Interactive web dashboard
+   ✅ Historical data analysis
+   ✅ JSON-based data storage
+   ✅ Cross-platform compatibility
+   ✅ Service deployment ready
+   ✅ Comprehensive logging
+
+🚀 HOW TO RUN:
+   1. 🌟 Full System:     python start_dashboard.py
+   2. 💻 Console Only:    python main.py
+   3. 📊 Dashboard Only:  streamlit run dashboard.py
+   4. 🎯 Interactive:     python quickstart.py
+   5. 🧪 Test System:     python test_system.py
+
+⚙️ CONFIGURATION:
+   • Copy .env.example to .env
+   • Configure email settings for alerts
+   • Set monitoring thresholds
+   • Define devices to monitor
+   • Customize monitoring intervals
+
+📊 DASHBOARD FEATURES:
+   • Real-time system metrics with gauge charts
+   • Network bandwidth visualization
+   • Device uptime and latency tracking
+   • Alert management with severity levels
+   • Historical data analysis
+   • Auto-refresh capabilities
+   • Interactive Plotly charts
+   • Mobile-responsive design
+
+📦 INSTALLATION:
+   1. Install Python 3.7+
+   2. pip install -r requirements.txt
+   3. cp .env.example .env
+   4. Edit .env with your settings
+   5. python quickstart.py
+
+📈 PROJECT STATUS:
+   🟢 Core Monitoring System: 100% Complete
+   🟢 Web Dashboard: 100% Complete
+   🟢 Email Alert System: 100% Complete
+   🟢 Data Storage & Logging: 100% Complete
+   🟢 Documentation: 100% Complete
+   🟢 Testing Framework: 100% Complete
+   🟢 Installation Scripts: 100% Complete
+   🟢 Cross-platform Support: 100% Complete
+
+   🎉 OVERALL PROJECT COMPLETION: 100%
+   ✅ PRODUCTION READY!
+
+📁 FILE STATUS:
+{file_status}
+   📂 src/ directory:
+{src_status}
+
+🎯 NEXT STEPS:
+   1. Configure .env file with your email settings
+   2. Run 'python test_system.py' to verify installation
+   3. Start with 'python quickstart.py' for guided setup
+   4. Access web dashboard at http://localhost:8501
+   5. Monitor logs in logs/network_monitor.log
+
+{banner}
+   Generated: {generated}
+   Network Monitoring System - Ready for Production! 🚀
+{banner}
+"""
+
+ESSENTIAL_FILES = [
+    "main.py", "dashboard.py", "start_dashboard.py", "quickstart.py",
+    "utils.py", "test_system.py", "setup.py", "requirements.txt",
+    ".env.example", "README.md"
+]
+
+SRC_FILES = [
+    "src/__init__.py", "src/config.py", "src/network_monitor.py",
+    "src/alert_manager.py", "src/data_logger.py", "src/packet_analyzer.py"
+]
+
 def display_project_info():
     """Display comprehensive project information"""
-    
-    print("🌐" + "="*70 + "🌐")
-    print("   NETWORK MONITORING AND ALERT SYSTEM - PROJECT STATUS")
-    print("🌐" + "="*70 + "🌐")
-    print()
-    
-    # Project Overview
-    print("📊 PROJECT OVERVIEW:")
-    print("   • Real-time network monitoring with bandwidth tracking")
-    print("   • System performance monitoring (CPU, Memory, Disk)")
-    print("   • Device connectivity monitoring with ping checks")
-    print("   • Intelligent anomaly detection and alerting")
-    print("   • Interactive web dashboard with Streamlit")
-    print("   • Email notification system with SMTP integration")
-    print()
-    
-    # Tech Stack
-    print("💻 TECHNOLOGY STACK:")
-    print("   • Python 3.7+ (Core Language)")
-    print("   • psutil (System & Network Monitoring)")
-    print("   • Streamlit (Web Dashboard Framework)")
-    print("   • Plotly (Data Visualization)")
-    print("   • Pandas (Data Analysis)")
-    print("   • smtplib (Email Notifications)")
-    print("   • JSON (Data Storage)")
-    print("   • Threading (Concurrent Monitoring)")
-    print()
-    
-    # Architecture
-    print("🏗️ SYSTEM ARCHITECTURE:")
-    print("   ┌─────────────────────────────────────────────┐")
-    print("   │  Web Dashboard  │  Console UI  │  Email Alerts │")
-    print("   ├─────────────────────────────────────────────┤")
-    print("   │  Network Thread │ System Thread │ Device Thread │")
-    print("   ├─────────────────────────────────────────────┤")
-    print("   │  Data Logger    │ Alert Manager │ Config Mgr   │")
-    print("   ├─────────────────────────────────────────────┤")
-    print("   │           JSON Data Storage Layer           │")
-    print("   └─────────────────────────────────────────────┘")
-    print()
-    
-    # File Structure
-    print("📁 PROJECT STRUCTURE:")
-    print("   network/")
-    print("   ├── 🚀 main.py                 # Main monitoring application")
-    print("   ├── 📊 dashboard.py            # Streamlit web dashboard")
-    print("   ├── 🔗 start_dashboard.py      # Integrated launcher")
-    print("   ├── 🎯 quickstart.py           # Interactive menu")
-    print("   ├── 🔧 utils.py                # Command-line utilities")
-    print("   ├── 🧪 test_system.py          # System tests")
-    print("   ├── ⚙️ setup.py               # Installation script")
-    print("   ├── 📦 requirements.txt        # Dependencies")
-    print("   ├── 📋 .env.example           # Configuration template")
-    print("   ├── 📖 README.md              # Complete documentation")
-    print("   ├── 📂 src/                   # Core modules")
-    print("   │   ├── config.py             # Configuration management")
-    print("   │   ├── network_monitor.py    # Network monitoring core")
-    print("   │   ├── alert_manager.py      # Alert system")
-    print("   │   ├── data_logger.py        # Data persistence")
-    print("   │   └── packet_analyzer.py    # Advanced analysis")
-    print("   ├── 📝 logs/                  # Application logs")
-    print("   └── 💾 data/                  # Monitoring data")
-    print()
-    
-    # Features Summary
-    print("🌟 KEY FEATURES:")
-    print("   ✅ Real-time bandwidth monitoring (Upload/Download)")
-    print("   ✅ System resource tracking (CPU/Memory/Disk)")
-    print("   ✅ Device connectivity monitoring (Ping-based)")
-    print("   ✅ Intelligent anomaly detection")
-    print("   ✅ Multi-threaded concurrent monitoring")
-    print("   ✅ SMTP email alert system")
-    print("   ✅ Interactive web dashboard")
-    print("   ✅ Historical data analysis")
-    print("   ✅ JSON-based data storage")
-    print("   ✅ Cross-platform compatibility")
-    print("   ✅ Service deployment ready")
-    print("   ✅ Comprehensive logging")
-    print()
-    
-    # Usage Options
-    print("🚀 HOW TO RUN:")
-    print("   1. 🌟 Full System:     python start_dashboard.py")
-    print("   2. 💻 Console Only:    python main.py")
-    print("   3. 📊 Dashboard Only:  streamlit run dashboard.py")
-    print("   4. 🎯 Interactive:     python quickstart.py")
-    print("   5. 🧪 Test System:     python test_system.py")
-    print()
-    
-    # Configuration
-    print("⚙️ CONFIGURATION:")
-    print("   • Copy .env.example to .env")
-    print("   • Configure email settings for alerts")
-    print("   • Set monitoring thresholds")
-    print("   • Define devices to monitor")
-    print("   • Customize monitoring intervals")
-    print()
-    
-    # Dashboard Features
-    print("📊 DASHBOARD FEATURES:")
-    print("   • Real-time system metrics with gauge charts")
-    print("   • Network bandwidth visualization")
-    print("   • Device uptime and latency tracking")
-    print("   • Alert management with severity levels")
-    print("   • Historical data analysis")
-    print("   • Auto-refresh capabilities")
-    print("   • Interactive Plotly charts")
-    print("   • Mobile-responsive design")
-    print()
-    
-    # Installation
-    print("📦 INSTALLATION:")
-    print("   1. Install Python 3.7+")
-    print("   2. pip install -r requirements.txt")
-    print("   3. cp .env.example .env")
-    print("   4. Edit .env with your settings")
-    print("   5. python quickstart.py")
-    print()
-    
-    # Project Status
-    print("📈 PROJECT STATUS:")
-    print("   🟢 Core Monitoring System: 100% Complete")
-    print("   🟢 Web Dashboard: 100% Complete") 
-    print("   🟢 Email Alert System: 100% Complete")
-    print("   🟢 Data Storage & Logging: 100% Complete")
-    print("   🟢 Documentation: 100% Complete")
-    print("   🟢 Testing Framework: 100% Complete")
-    print("   🟢 Installation Scripts: 100% Complete")
-    print("   🟢 Cross-platform Support: 100% Complete")
-    print()
-    print("   🎉 OVERALL PROJECT COMPLETION: 100%")
-    print("   ✅ PRODUCTION READY!")
-    print()
-    
-    # File Status
-    print("📁 FILE STATUS:")
     current_dir = os.path.dirname(os.path.abspath(__file__))
-    essential_files = [
-        "main.py", "dashboard.py", "start_dashboard.py", "quickstart.py",
-        "utils.py", "test_system.py", "setup.py", "requirements.txt",
-        ".env.example", "README.md"
-    ]
-    
-    for file in essential_files:
-        filepath = os.path.join(current_dir, file)
-        status = "✅" if os.path.exists(filepath) else "❌"
-        print(f"   {status} {file}")
-    
-    # Check src directory
-    src_files = [
-        "src/__init__.py", "src/config.py", "src/network_monitor.py",
-        "src/alert_manager.py", "src/data_logger.py", "src/packet_analyzer.py"
-    ]
-    
-    print("   📂 src/ directory:")
-    for file in src_files:
-        filepath = os.path.join(current_dir, file)
-        status = "✅" if os.path.exists(filepath) else "❌"
-        print(f"      {status} {file}")
-    
-    print()
-    
-    # Next Steps
-    print("🎯 NEXT STEPS:")
-    print("   1. Configure .env file with your email settings")
-    print("   2. Run 'python test_system.py' to verify installation")
-    print("   3. Start with 'python quickstart.py' for guided setup")
-    print("   4. Access web dashboard at http://localhost:8501")
-    print("   5. Monitor logs in logs/network_monitor.log")
-    print()
-    
-    print("🌐" + "="*70 + "🌐")
-    print(f"   Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("   Network Monitoring System - Ready for Production! 🚀")
-    print("🌐" + "="*70 + "🌐")
+
+    # One directory listing per level instead of a stat() per file
+    try:
+        root_names = {entry.name for entry in os.scandir(current_dir)}
+    except OSError:
+        root_names = set()
+    try:
+        src_names = {entry.name for entry in os.scandir(os.path.join(current_dir, 'src'))}
+    except OSError:
+        src_names = set()
+
+    file_status = "\n".join(
+        f"   {'✅' if file in root_names else '❌'} {file}"
+        for file in ESSENTIAL_FILES
+    )
+    src_status = "\n".join(
+        f"      {'✅' if file.split('/', 1)[1] in src_names else '❌'} {file}"
+        for file in SRC_FILES
+    )
+
+    sys.stdout.write(TEMPLATE.format(
+        banner=BANNER,
+        file_status=file_status,
+        src_status=src_status,
+        generated=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    ))
 
 def main():
     display_project_info()
@@ -8,6 +8,22 @@ import os
 import sys
 import subprocess
 
+try:
+    import readline  # noqa: F401 - line editing/history for the prompt
+except ImportError:
+    readline = None
+
+# Menu dispatch table: O(1) lookup, and adding an option is a one-line change.
+# The flag says whether the menu process should be replaced (os.execvp) or
+# kept alive to return to after the command finishes (subprocess.run).
+COMMANDS = {
+    "1": ("🚀 Starting full system...", ("start_dashboard.py",), True),
+    "2": ("💻 Starting monitoring only...", ("main.py",), True),
+    "3": ("📊 Starting dashboard only...", ("-m", "streamlit", "run", "dashboard.py"), True),
+    "4": ("🧪 Running tests...", ("test_system.py",), False),
+    "5": ("⚙️ Running setup...", ("setup.py",), True),
+}
+
 def main():
     print("🚀 Network Monitoring System - Quick Start")
     print("=" * 50)
@@ -26,21 +42,16 @@ def main():
         if choice == "0":
             print("👋 Goodbye!")
             break
-        elif choice == "1":
-            print("🚀 Starting full system...")
-            subprocess.run([sys.executable, "start_dashboard.py"])
-        elif choice == "2":
-            print("💻 Starting monitoring only...")
-            subprocess.run([sys.executable, "main.py"])
-        elif choice == "3":
-            print("📊 Starting dashboard only...")
-            subprocess.run([sys.executable, "-m", "streamlit", "run", "dashboard.py"])
-        elif choice == "4":
-            print("🧪 Running tests...")
-            subprocess.run([sys.executable, "test_system.py"])
-        elif choice == "5":
-            print("⚙️ Running setup...")
-            subprocess.run([sys.executable, "setup.py"])
+        elif choice in COMMANDS:
+            message, args, replace = COMMANDS[choice]
+            print(message)
+            if replace:
+                # Replace the menu process entirely — no reason to keep an
+                # idle interpreter resident while the component runs
+                os.execvp(sys.executable, [sys.executable, *args])
+            else:
+                # Tests finish quickly and the user returns to the menu
+                subprocess.run([sys.executable, *args])
         elif choice == "6":
             print("\n🔧 Available utilities:")
             print("  python utils.py test          # Test connectivity")
@@ -9,14 +9,28 @@ __version__ = "1.0.0"
 __author__ = "Network Monitoring Team"
 __email__ = "network@company.com"
 
-from .config import Config
-from .network_monitor import NetworkMonitor
-from .alert_manager import AlertManager
-from .data_logger import DataLogger
-
 __all__ = [
     'Config',
-    'NetworkMonitor', 
+    'NetworkMonitor',
     'AlertManager',
     'DataLogger'
 ]
+
+# PEP 562 lazy loading: submodules (and their psutil/smtplib/dotenv
+# dependencies) import on first attribute access rather than every time
+# any src.* symbol is touched, keeping package import near-instant
+_LAZY = {
+    'Config': 'config',
+    'NetworkMonitor': 'network_monitor',
+    'AlertManager': 'alert_manager',
+    'DataLogger': 'data_logger',
+}
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is not None:
+        module = __import__(f"{__name__}.{module_name}", fromlist=[name])
+        value = getattr(module, name)
+        globals()[name] = value  # cache so later accesses skip this hook
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,12 +1,104 @@
-import smtplib
+import atexit
 import logging
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import string
+import time
+from collections import Counter, defaultdict, deque
 from datetime import datetime, timedelta
+
+# smtplib and email.mime are imported inside the send paths: they cost
+# tens of ms at startup and are never needed unless an alert actually
+# goes out (sys.modules caching makes repeat imports free)
 from typing import List, Dict, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+# Severity palette shared by single-alert and digest bodies
+SEVERITY_COLORS = {
+    'low': '#28a745',      # Green
+    'medium': '#ffc107',   # Yellow
+    'high': '#fd7e14',     # Orange
+    'critical': '#dc3545'  # Red
+}
+DEFAULT_SEVERITY_COLOR = '#6c757d'
+
+# Interned display forms for the four known severities; unknown values
+# fall back to an actual .upper() call
+_SEV_UPPER = {k: k.upper() for k in ('low', 'medium', 'high', 'critical')}
+
+# Static HTML skeletons built once at import; per-alert sends only pay
+# for placeholder substitution, not for reconstructing the template
+_BODY_TEMPLATE = string.Template("""
+        <html>
+        <body>
+            <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
+                <div style="background-color: $color; color: white; padding: 20px; text-align: center;">
+                    <h1 style="margin: 0;">Network Monitoring Alert</h1>
+                </div>
+
+                <div style="padding: 20px; background-color: #f8f9fa;">
+                    <h2 style="color: $color; margin-top: 0;">$alert_type</h2>
+
+                    <table style="width: 100%; border-collapse: collapse;">
+                        <tr>
+                            <td style="padding: 8px; border-bottom: 1px solid #dee2e6; font-weight: bold;">Severity:</td>
+                            <td style="padding: 8px; border-bottom: 1px solid #dee2e6; color: $color; font-weight: bold;">$severity_upper</td>
+                        </tr>
+                        <tr>
+                            <td style="padding: 8px; border-bottom: 1px solid #dee2e6; font-weight: bold;">Timestamp:</td>
+                            <td style="padding: 8px; border-bottom: 1px solid #dee2e6;">$ts</td>
+                        </tr>
+                        <tr>
+                            <td style="padding: 8px; border-bottom: 1px solid #dee2e6; font-weight: bold;">Message:</td>
+                            <td style="padding: 8px; border-bottom: 1px solid #dee2e6;">$message</td>
+                        </tr>
+                    </table>
+                </div>
+
+                <div style="padding: 20px; background-color: #e9ecef; text-align: center; font-size: 12px; color: #6c757d;">
+                    This alert was generated by the Network Monitoring System.<br>
+                    Please investigate and take appropriate action if necessary.
+                </div>
+            </div>
+        </body>
+        </html>
+        """)
+
+_DIGEST_ROW_TEMPLATE = string.Template("""<tr>
+                <td style="padding: 8px; border-bottom: 1px solid #dee2e6; color: $color; font-weight: bold;">$severity_upper</td>
+                <td style="padding: 8px; border-bottom: 1px solid #dee2e6; font-weight: bold;">$alert_type</td>
+                <td style="padding: 8px; border-bottom: 1px solid #dee2e6;">$ts</td>
+                <td style="padding: 8px; border-bottom: 1px solid #dee2e6;">$message</td>
+            </tr>""")
+
+_DIGEST_BODY_TEMPLATE = string.Template("""
+        <html>
+        <body>
+            <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
+                <div style="background-color: #343a40; color: white; padding: 20px; text-align: center;">
+                    <h1 style="margin: 0;">Network Monitoring Alerts</h1>
+                </div>
+
+                <div style="padding: 20px; background-color: #f8f9fa;">
+                    <table style="width: 100%; border-collapse: collapse;">
+                        <tr>
+                            <th style="padding: 8px; text-align: left;">Severity</th>
+                            <th style="padding: 8px; text-align: left;">Type</th>
+                            <th style="padding: 8px; text-align: left;">Timestamp</th>
+                            <th style="padding: 8px; text-align: left;">Message</th>
+                        </tr>
+                        $rows
+                    </table>
+                </div>
+
+                <div style="padding: 20px; background-color: #e9ecef; text-align: center; font-size: 12px; color: #6c757d;">
+                    This alert digest was generated by the Network Monitoring System.<br>
+                    Please investigate and take appropriate action if necessary.
+                </div>
+            </div>
+        </body>
+        </html>
+        """)
 
-@dataclass
+@dataclass(slots=True)
 class Alert:
     """Data class for alerts"""
     alert_type: str
@@ -14,45 +106,166 @@ class Alert:
     severity: str  # 'low', 'medium', 'high', 'critical'
     timestamp: datetime
     resolved: bool = False
+    # Display form computed once; subjects and HTML bodies reuse it
+    severity_upper: str = field(init=False)
+
+    def __post_init__(self):
+        self.severity_upper = _SEV_UPPER.get(self.severity) or self.severity.upper()
 
 class AlertManager:
     """Manages alerts and notifications"""
-    
-    def __init__(self, smtp_server: str, smtp_port: int, email_user: str, 
-                 email_password: str, recipients: List[str], cooldown_minutes: int = 15):
+
+    # System threshold rules: (stats attr, alert type, metric noun,
+    # thresholds key, default threshold, escalation threshold,
+    # escalated severity, base severity). Adding a metric is one row.
+    _SYS_RULES = (
+        ('cpu_percent', 'High CPU Usage', 'CPU', 'cpu', 80, 90, 'high', 'medium'),
+        ('memory_percent', 'High Memory Usage', 'Memory', 'memory', 85, 95, 'high', 'medium'),
+        ('disk_percent', 'High Disk Usage', 'Disk', 'disk', 90, 95, 'critical', 'high'),
+    )
+
+    # Bandwidth rules: (alert type, direction noun)
+    _NET_RULES = (
+        ('High Upload Bandwidth', 'Upload'),
+        ('High Download Bandwidth', 'Download'),
+    )
+
+    # Bound once at class scope so the send path allocates no literals;
+    # the color palette itself lives at module level (shared with the
+    # HTML templates)
+    _SEVERITY_COLORS = SEVERITY_COLORS
+    _SUBJECT_FMT = "[{sev}] Network Alert: {type}"
+
+
+    def __init__(self, smtp_server: str, smtp_port: int, email_user: str,
+                 email_password: str, recipients: List[str], cooldown_minutes: int = 15,
+                 use_ssl: Optional[bool] = None, thresholds: Optional[Dict[str, float]] = None):
         self.smtp_server = smtp_server
         self.smtp_port = smtp_port
+        # Implicit TLS (SMTPS) when asked for or on the conventional port
+        self.use_ssl = (smtp_port == 465) if use_ssl is None else use_ssl
         self.email_user = email_user
         self.email_password = email_password
-        self.recipients = [r.strip() for r in recipients if r.strip()]
+        # Config hands over an already-stripped tuple; re-filter only if a
+        # caller passes a raw list of its own
+        self.recipients = recipients if isinstance(recipients, tuple) else \
+            [r.strip() for r in recipients if r.strip()]
         self.cooldown_minutes = cooldown_minutes
+        self._cooldown_sec = cooldown_minutes * 60
+        # Recipients don't change after construction; join the To: header once
+        self._to_header = ', '.join(self.recipients)
         self.logger = logging.getLogger(__name__)
         
-        # Track last alert times to implement cooldown
-        self.last_alert_times = {}
-        self.active_alerts = []
-        
+        # Track last alert times to implement cooldown. Unknown types
+        # default to -inf so the cooldown check needs no None branch.
+        # Alerts are kept in a bounded deque (appended in time order) so
+        # memory stays capped and expiry pops from the left instead of
+        # rescanning the whole history
+        self.last_alert_times = defaultdict(lambda: float('-inf'))
+        self.active_alerts = deque(maxlen=10_000)
+
+        # Resolve the system threshold values once, aligned with _SYS_RULES
+        self.configure_thresholds(thresholds or {})
+
+        # Severity/type tallies maintained incrementally as alerts enter
+        # and leave the deque, so summaries never rescan the history
+        self._sev_counts = Counter()
+        self._type_counts = Counter()
+
+        # Persistent SMTP connection, created lazily on first send and
+        # reused so each alert pays for TCP+TLS+AUTH only once per burst
+        self._smtp = None
+        atexit.register(self.close)
+
+    def _connect(self):
+        """Open and log in a fresh SMTP connection"""
+        import smtplib
+        import socket
+
+        if self.use_ssl:
+            # Implicit TLS: one handshake, no STARTTLS upgrade round-trip
+            server = smtplib.SMTP_SSL(self.smtp_server, self.smtp_port)
+        else:
+            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+            server.starttls()
+        server.login(self.email_user, self.email_password)
+
+        # TCP keepalive so NAT/firewalls don't silently drop the pooled
+        # connection between alert bursts
+        try:
+            sock = server.sock
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if hasattr(socket, 'TCP_KEEPIDLE'):  # Linux-only fine tuning
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 30)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+        except OSError:
+            pass  # keepalive is best-effort
+
+        return server
+
+    def _get_smtp(self):
+        """Return the cached SMTP connection, reconnecting if it went stale"""
+        import smtplib
+
+        if self._smtp is not None:
+            try:
+                self._smtp.noop()
+                return self._smtp
+            except (smtplib.SMTPException, OSError):
+                self._drop_smtp()
+
+        self._smtp = self._connect()
+        return self._smtp
+
+    def _drop_smtp(self):
+        """Discard the cached connection without raising"""
+        if self._smtp is not None:
+            try:
+                self._smtp.close()
+            except Exception:
+                pass
+            self._smtp = None
+
+    def close(self):
+        """Cleanly shut down the cached SMTP connection"""
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except Exception:
+                pass
+            self._smtp = None
+
     def should_send_alert(self, alert_type: str) -> bool:
         """Check if enough time has passed since last alert of this type"""
-        last_alert_time = self.last_alert_times.get(alert_type)
-        
-        if last_alert_time is None:
-            return True
-        
-        time_since_last = datetime.now() - last_alert_time
-        return time_since_last.total_seconds() >= (self.cooldown_minutes * 60)
+        # Cooldowns are tracked as monotonic floats: one lookup, one
+        # subtraction, one compare — no datetime allocation, no None
+        # branch, immune to wall-clock jumps
+        return time.monotonic() - self.last_alert_times[alert_type] >= self._cooldown_sec
     
-    def create_alert(self, alert_type: str, message: str, severity: str = 'medium') -> Alert:
-        """Create a new alert"""
+    def create_alert(self, alert_type: str, message: str, severity: str = 'medium',
+                     now: Optional[datetime] = None) -> Alert:
+        """Create a new alert
+
+        Callers creating several alerts in one cycle can pass a shared
+        `now` so the batch carries one wall-clock read and one timestamp.
+        """
         alert = Alert(
             alert_type=alert_type,
             message=message,
             severity=severity,
-            timestamp=datetime.now()
+            timestamp=now or datetime.now()
         )
-        
+
+        # A full deque silently drops its oldest entry on append; keep the
+        # tallies in sync by discounting it first
+        if len(self.active_alerts) == self.active_alerts.maxlen:
+            self._discount(self.active_alerts[0])
+
         self.active_alerts.append(alert)
-        self.logger.info(f"Alert created: [{severity.upper()}] {alert_type}: {message}")
+        self._sev_counts[severity] += 1
+        self._type_counts[alert_type] += 1
+        self.logger.info("Alert created: [%s] %s: %s", alert.severity_upper, alert_type, message)
         
         return alert
     
@@ -63,201 +276,225 @@ class AlertManager:
             return False
         
         if not self.should_send_alert(alert.alert_type):
-            self.logger.info(f"Alert {alert.alert_type} is in cooldown period, skipping email")
+            self.logger.info("Alert %s is in cooldown period, skipping email", alert.alert_type)
             return False
-        
+
+        import smtplib
+        from email.mime.text import MIMEText
+
         try:
-            # Create email message
-            msg = MIMEMultipart()
+            # A single HTML part needs no multipart container — smaller
+            # payload, no boundary generation
+            msg = MIMEText(self._create_email_body(alert), 'html', 'utf-8')
             msg['From'] = self.email_user
-            msg['To'] = ', '.join(self.recipients)
-            msg['Subject'] = f"[{alert.severity.upper()}] Network Alert: {alert.alert_type}"
-            
-            # Create email body
-            body = self._create_email_body(alert)
-            msg.attach(MIMEText(body, 'html'))
-            
-            # Send email
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.email_user, self.email_password)
-                server.send_message(msg)
+            msg['To'] = self._to_header
+            msg['Subject'] = self._SUBJECT_FMT.format(sev=alert.severity_upper, type=alert.alert_type)
             
+            # Send over the persistent connection; retry once on a stale
+            # socket (server-side idle timeouts are routine between bursts)
+            try:
+                self._get_smtp().send_message(msg)
+            except (smtplib.SMTPServerDisconnected, smtplib.SMTPException, OSError):
+                self._drop_smtp()
+                self._get_smtp().send_message(msg)
+
             # Update last alert time
-            self.last_alert_times[alert.alert_type] = datetime.now()
-            self.logger.info(f"Email alert sent successfully for {alert.alert_type}")
+            self.last_alert_times[alert.alert_type] = time.monotonic()
+            self.logger.info("Email alert sent successfully for %s", alert.alert_type)
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to send email alert: {e}")
+            self.logger.error("Failed to send email alert: %s", e)
             return False
     
     def _create_email_body(self, alert: Alert) -> str:
         """Create HTML email body for alert"""
-        severity_colors = {
-            'low': '#28a745',      # Green
-            'medium': '#ffc107',   # Yellow
-            'high': '#fd7e14',     # Orange
-            'critical': '#dc3545'  # Red
-        }
-        
-        color = severity_colors.get(alert.severity, '#6c757d')
-        
-        return f"""
-        <html>
-        <body>
-            <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
-                <div style="background-color: {color}; color: white; padding: 20px; text-align: center;">
-                    <h1 style="margin: 0;">Network Monitoring Alert</h1>
-                </div>
-                
-                <div style="padding: 20px; background-color: #f8f9fa;">
-                    <h2 style="color: {color}; margin-top: 0;">{alert.alert_type}</h2>
-                    
-                    <table style="width: 100%; border-collapse: collapse;">
-                        <tr>
-                            <td style="padding: 8px; border-bottom: 1px solid #dee2e6; font-weight: bold;">Severity:</td>
-                            <td style="padding: 8px; border-bottom: 1px solid #dee2e6; color: {color}; font-weight: bold;">{alert.severity.upper()}</td>
-                        </tr>
-                        <tr>
-                            <td style="padding: 8px; border-bottom: 1px solid #dee2e6; font-weight: bold;">Timestamp:</td>
-                            <td style="padding: 8px; border-bottom: 1px solid #dee2e6;">{alert.timestamp.strftime('%Y-%m-%d %H:%M:%S')}</td>
-                        </tr>
-                        <tr>
-                            <td style="padding: 8px; border-bottom: 1px solid #dee2e6; font-weight: bold;">Message:</td>
-                            <td style="padding: 8px; border-bottom: 1px solid #dee2e6;">{alert.message}</td>
-                        </tr>
-                    </table>
-                </div>
-                
-                <div style="padding: 20px; background-color: #e9ecef; text-align: center; font-size: 12px; color: #6c757d;">
-                    This alert was generated by the Network Monitoring System.<br>
-                    Please investigate and take appropriate action if necessary.
-                </div>
-            </div>
-        </body>
-        </html>
-        """
+        return _BODY_TEMPLATE.substitute(
+            color=SEVERITY_COLORS.get(alert.severity, DEFAULT_SEVERITY_COLOR),
+            alert_type=alert.alert_type,
+            severity_upper=alert.severity_upper,
+            ts=alert.timestamp.strftime('%Y-%m-%d %H:%M:%S'),
+            message=alert.message
+        )
     
-    def process_system_alerts(self, system_stats, thresholds: Dict[str, float]) -> List[Alert]:
+    def configure_thresholds(self, thresholds: Dict[str, float]):
+        """Resolve the system thresholds into a tuple aligned with _SYS_RULES
+
+        Doing the keyed lookups (with defaults) once here means each poll
+        reads plain floats instead of hashing string keys per metric.
+        """
+        self._sys_thresholds = tuple(
+            thresholds.get(rule[3], rule[4]) for rule in self._SYS_RULES
+        )
+
+    def process_system_alerts(self, system_stats, thresholds: Optional[Dict[str, float]] = None) -> List[Alert]:
         """Process system statistics and create alerts if thresholds are exceeded"""
+        if thresholds is not None:
+            # Legacy call shape: re-resolve before checking
+            self.configure_thresholds(thresholds)
+
         alerts = []
-        
-        # CPU Usage Alert
-        if system_stats.cpu_percent > thresholds.get('cpu', 80):
-            alert = self.create_alert(
-                alert_type="High CPU Usage",
-                message=f"CPU usage is {system_stats.cpu_percent:.1f}% (threshold: {thresholds.get('cpu', 80)}%)",
-                severity='high' if system_stats.cpu_percent > 90 else 'medium'
-            )
-            alerts.append(alert)
-        
-        # Memory Usage Alert
-        if system_stats.memory_percent > thresholds.get('memory', 85):
-            alert = self.create_alert(
-                alert_type="High Memory Usage",
-                message=f"Memory usage is {system_stats.memory_percent:.1f}% (threshold: {thresholds.get('memory', 85)}%)",
-                severity='high' if system_stats.memory_percent > 95 else 'medium'
-            )
-            alerts.append(alert)
-        
-        # Disk Usage Alert
-        if system_stats.disk_percent > thresholds.get('disk', 90):
-            alert = self.create_alert(
-                alert_type="High Disk Usage",
-                message=f"Disk usage is {system_stats.disk_percent:.1f}% (threshold: {thresholds.get('disk', 90)}%)",
-                severity='critical' if system_stats.disk_percent > 95 else 'high'
-            )
-            alerts.append(alert)
-        
+        now = datetime.now()
+
+        for (attr, alert_type, noun, key, default, crit_thr, crit_sev, base_sev), threshold \
+                in zip(self._SYS_RULES, self._sys_thresholds):
+            value = getattr(system_stats, attr)
+
+            if value > threshold:
+                alert = self.create_alert(
+                    alert_type=alert_type,
+                    message=f"{noun} usage is {value:.1f}% (threshold: {threshold}%)",
+                    severity=crit_sev if value > crit_thr else base_sev,
+                    now=now
+                )
+                alerts.append(alert)
+
         return alerts
-    
-    def process_network_alerts(self, upload_mbps: float, download_mbps: float, 
+
+    def process_network_alerts(self, upload_mbps: float, download_mbps: float,
                              anomalies: List[str], threshold: float) -> List[Alert]:
         """Process network statistics and create alerts"""
         alerts = []
-        
+        now = datetime.now()
+
         # Bandwidth threshold alerts
-        if upload_mbps > threshold:
-            alert = self.create_alert(
-                alert_type="High Upload Bandwidth",
-                message=f"Upload bandwidth is {upload_mbps:.2f} Mbps (threshold: {threshold} Mbps)",
-                severity='high' if upload_mbps > threshold * 1.5 else 'medium'
-            )
-            alerts.append(alert)
-        
-        if download_mbps > threshold:
-            alert = self.create_alert(
-                alert_type="High Download Bandwidth",
-                message=f"Download bandwidth is {download_mbps:.2f} Mbps (threshold: {threshold} Mbps)",
-                severity='high' if download_mbps > threshold * 1.5 else 'medium'
-            )
-            alerts.append(alert)
-        
+        for (alert_type, noun), value in zip(self._NET_RULES, (upload_mbps, download_mbps)):
+            if value > threshold:
+                alert = self.create_alert(
+                    alert_type=alert_type,
+                    message=f"{noun} bandwidth is {value:.2f} Mbps (threshold: {threshold} Mbps)",
+                    severity='high' if value > threshold * 1.5 else 'medium',
+                    now=now
+                )
+                alerts.append(alert)
+
         # Anomaly alerts
         for anomaly in anomalies:
             alert = self.create_alert(
                 alert_type="Network Traffic Anomaly",
                 message=anomaly,
-                severity='medium'
+                severity='medium',
+                now=now
             )
             alerts.append(alert)
-        
+
         return alerts
     
     def process_device_alerts(self, device_statuses: List) -> List[Alert]:
         """Process device ping results and create alerts for unreachable devices"""
         alerts = []
-        
+        now = datetime.now()
+
+        # Local aliases keep the per-device loop on LOAD_FAST lookups;
+        # this is the one loop here that can see hundreds of iterations
+        append = alerts.append
+        mk = self.create_alert
+
         for status in device_statuses:
             if not status.is_reachable:
-                alert = self.create_alert(
+                append(mk(
                     alert_type="Device Unreachable",
                     message=f"Device {status.ip_address} is not responding to ping",
-                    severity='high'
-                )
-                alerts.append(alert)
-            elif status.response_time and status.response_time > 1000:  # > 1 second
-                alert = self.create_alert(
-                    alert_type="High Latency",
-                    message=f"Device {status.ip_address} has high latency: {status.response_time:.1f}ms",
-                    severity='medium'
-                )
-                alerts.append(alert)
+                    severity='high',
+                    now=now
+                ))
+            else:
+                response_time = status.response_time
+                if response_time is not None and response_time > 1000:  # > 1 second
+                    append(mk(
+                        alert_type="High Latency",
+                        message=f"Device {status.ip_address} has high latency: {response_time:.1f}ms",
+                        severity='medium',
+                        now=now
+                    ))
         
         return alerts
     
+    def send_digest(self, alerts: List[Alert]) -> bool:
+        """Send one digest email covering a batch of alerts
+
+        Collapses N SMTP transactions (and N inbox entries) into one; the
+        subject carries the highest severity in the batch.
+        """
+        if not self.recipients:
+            self.logger.warning("No email recipients configured")
+            return False
+
+        eligible = [a for a in alerts if self.should_send_alert(a.alert_type)]
+        if not eligible:
+            self.logger.info("All alerts in cooldown period, skipping digest")
+            return False
+
+        import smtplib
+        from email.mime.text import MIMEText
+
+        try:
+            severity_rank = {'low': 0, 'medium': 1, 'high': 2, 'critical': 3}
+            max_severity = max(eligible, key=lambda a: severity_rank.get(a.severity, 0)).severity
+
+            msg = MIMEText(self._create_digest_body(eligible), 'html', 'utf-8')
+            msg['From'] = self.email_user
+            msg['To'] = self._to_header
+            msg['Subject'] = f"[{max_severity.upper()}] {len(eligible)} Network Alerts"
+
+            try:
+                self._get_smtp().send_message(msg)
+            except (smtplib.SMTPServerDisconnected, smtplib.SMTPException, OSError):
+                self._drop_smtp()
+                self._get_smtp().send_message(msg)
+
+            # One clock read covers the whole batch
+            now = time.monotonic()
+            for alert in eligible:
+                self.last_alert_times[alert.alert_type] = now
+
+            self.logger.info("Digest email sent for %d alert(s)", len(eligible))
+            return True
+
+        except Exception as e:
+            self.logger.error("Failed to send digest email: %s", e)
+            return False
+
+    def _create_digest_body(self, alerts: List[Alert]) -> str:
+        """Create HTML email body listing a batch of alerts in one table"""
+        rows = "\n".join(
+            _DIGEST_ROW_TEMPLATE.substitute(
+                color=SEVERITY_COLORS.get(alert.severity, DEFAULT_SEVERITY_COLOR),
+                severity_upper=alert.severity_upper,
+                alert_type=alert.alert_type,
+                ts=alert.timestamp.strftime('%Y-%m-%d %H:%M:%S'),
+                message=alert.message
+            )
+            for alert in alerts
+        )
+
+        return _DIGEST_BODY_TEMPLATE.substitute(rows=rows)
+
     def send_all_alerts(self, alerts: List[Alert]) -> Dict[str, int]:
-        """Send all alerts via email"""
-        results = {'sent': 0, 'failed': 0}
-        
-        for alert in alerts:
-            if self.send_email_alert(alert):
-                results['sent'] += 1
-            else:
-                results['failed'] += 1
-        
-        return results
+        """Send all alerts via one digest email"""
+        if not alerts:
+            return {'sent': 0, 'failed': 0}
+
+        if self.send_digest(alerts):
+            return {'sent': len(alerts), 'failed': 0}
+        return {'sent': 0, 'failed': len(alerts)}
     
     def get_alert_summary(self) -> Dict:
         """Get summary of active alerts"""
-        summary = {
+        # Expire alerts older than 24h from the left; the deque is in time
+        # order so eviction touches only what actually aged out
+        cutoff_time = datetime.now() - timedelta(hours=24)
+        while self.active_alerts and self.active_alerts[0].timestamp < cutoff_time:
+            self._discount(self.active_alerts.popleft())
+
+        return {
             'total_alerts': len(self.active_alerts),
-            'by_severity': {},
-            'by_type': {},
-            'recent_alerts': []
+            'by_severity': {sev: n for sev, n in self._sev_counts.items() if n},
+            'by_type': {typ: n for typ, n in self._type_counts.items() if n},
+            'recent_alerts': list(self.active_alerts)
         }
-        
-        # Count by severity
-        for alert in self.active_alerts:
-            summary['by_severity'][alert.severity] = summary['by_severity'].get(alert.severity, 0) + 1
-            summary['by_type'][alert.alert_type] = summary['by_type'].get(alert.alert_type, 0) + 1
-        
-        # Get recent alerts (last 24 hours)
-        cutoff_time = datetime.now() - timedelta(hours=24)
-        summary['recent_alerts'] = [
-            alert for alert in self.active_alerts 
-            if alert.timestamp >= cutoff_time
-        ]
-        
-        return summary
+
+    def _discount(self, alert: Alert):
+        """Remove one alert's contribution from the running tallies"""
+        self._sev_counts[alert.severity] -= 1
+        self._type_counts[alert.alert_type] -= 1
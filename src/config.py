@@ -5,15 +5,22 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+def _csv(value: str) -> tuple:
+    """Parse a comma-separated env value into a stripped, empty-free tuple"""
+    return tuple(item for item in (token.strip() for token in value.split(',')) if item)
+
 class Config:
     """Configuration management for the network monitoring system"""
     
     # SMTP Configuration
     SMTP_SERVER = os.getenv('SMTP_SERVER', 'smtp.gmail.com')
     SMTP_PORT = int(os.getenv('SMTP_PORT', 587))
+    # Implicit TLS skips the STARTTLS upgrade round-trips; port 465 is the
+    # conventional SMTPS port so it defaults the flag on
+    SMTP_USE_SSL = os.getenv('SMTP_USE_SSL', '').lower() in ('1', 'true', 'yes') or SMTP_PORT == 465
     EMAIL_USER = os.getenv('EMAIL_USER')
     EMAIL_PASSWORD = os.getenv('EMAIL_PASSWORD')
-    ALERT_RECIPIENTS = os.getenv('ALERT_RECIPIENTS', '').split(',')
+    ALERT_RECIPIENTS = _csv(os.getenv('ALERT_RECIPIENTS', ''))
     
     # Monitoring Thresholds
     BANDWIDTH_THRESHOLD_MBPS = float(os.getenv('BANDWIDTH_THRESHOLD_MBPS', 100))
@@ -28,27 +35,37 @@ class Config:
     DEVICE_PING_INTERVAL = int(os.getenv('DEVICE_PING_INTERVAL', 120))
     
     # Devices to monitor
-    MONITORED_DEVICES = os.getenv('MONITORED_DEVICES', '8.8.8.8,1.1.1.1').split(',')
+    MONITORED_DEVICES = _csv(os.getenv('MONITORED_DEVICES', '8.8.8.8,1.1.1.1'))
     
     # Alert Settings
     ALERT_COOLDOWN_MINUTES = int(os.getenv('ALERT_COOLDOWN_MINUTES', 15))
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
     LOG_FILE = os.getenv('LOG_FILE', 'logs/network_monitor.log')
-    
+
+    # Numeric log level resolved once at class definition; an unknown name
+    # falls back to INFO instead of raising deep inside setup_logging
+    LOG_LEVEL_NUM = getattr(logging, LOG_LEVEL.upper(), logging.INFO)
+
     @classmethod
     def setup_logging(cls):
         """Setup logging configuration"""
+        # basicConfig is a no-op once handlers exist; skip the directory
+        # stat and handler construction on repeat calls too
+        if logging.getLogger().handlers:
+            return logging.getLogger(__name__)
+
         os.makedirs(os.path.dirname(cls.LOG_FILE), exist_ok=True)
-        
+
         logging.basicConfig(
-            level=getattr(logging, cls.LOG_LEVEL.upper()),
+            level=cls.LOG_LEVEL_NUM,
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             handlers=[
-                logging.FileHandler(cls.LOG_FILE),
+                # delay=True defers opening the file until the first record
+                logging.FileHandler(cls.LOG_FILE, delay=True),
                 logging.StreamHandler()
             ]
         )
-        
+
         return logging.getLogger(__name__)
     
     @classmethod
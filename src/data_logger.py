@@ -1,265 +1,566 @@
+import atexit
 import json
 import os
+import sqlite3
+import threading
+import time
 from datetime import datetime
 from typing import Dict, List, Any
 import logging
 
+# Fastest JSON codec available: orjson (SIMD C extension, ~5x stdlib),
+# then ujson, then the stdlib as the always-present fallback. Only the
+# anomalies list still goes through JSON — everything else is typed
+# SQLite columns now.
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, default=str).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    try:
+        import ujson
+
+        def _dumps(obj) -> str:
+            return ujson.dumps(obj, default=str)
+
+        _loads = ujson.loads
+    except ImportError:
+        def _dumps(obj) -> str:
+            return json.dumps(obj, default=str)
+
+        _loads = json.loads
+
+# Compact dtypes for history DataFrames; halves the bytes moved by
+# aggregation and chart serialization without losing display precision
+HISTORY_DTYPES = {
+    'cpu_percent': 'float32',
+    'memory_percent': 'float32',
+    'disk_percent': 'float32',
+    'upload_mbps': 'float32',
+    'download_mbps': 'float32',
+    'response_time': 'float32',
+    'is_reachable': 'bool',
+}
+
+# One table per data kind, indexed on timestamp so time-range queries
+# walk the index instead of scanning history in Python
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS network_data (
+    timestamp REAL NOT NULL,
+    upload_mbps REAL,
+    download_mbps REAL,
+    bytes_sent INTEGER,
+    bytes_recv INTEGER,
+    packets_sent INTEGER,
+    packets_recv INTEGER,
+    anomalies TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_network_ts ON network_data (timestamp);
+
+CREATE TABLE IF NOT EXISTS system_data (
+    timestamp REAL NOT NULL,
+    cpu_percent REAL,
+    memory_percent REAL,
+    disk_percent REAL
+);
+CREATE INDEX IF NOT EXISTS idx_system_ts ON system_data (timestamp);
+
+CREATE TABLE IF NOT EXISTS device_data (
+    timestamp REAL NOT NULL,
+    ip_address TEXT,
+    is_reachable INTEGER,
+    response_time REAL
+);
+CREATE INDEX IF NOT EXISTS idx_device_ts ON device_data (timestamp);
+CREATE INDEX IF NOT EXISTS idx_device_ip ON device_data (ip_address);
+
+CREATE TABLE IF NOT EXISTS alert_data (
+    timestamp REAL NOT NULL,
+    alert_type TEXT,
+    message TEXT,
+    severity TEXT,
+    resolved INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_alert_ts ON alert_data (timestamp);
+"""
+
+# Column order for legacy JSONL imports, per table
+_LEGACY_FILES = {
+    'network_data.json': ('network_data',
+                          ('upload_mbps', 'download_mbps', 'bytes_sent',
+                           'bytes_recv', 'packets_sent', 'packets_recv')),
+    'system_data.json': ('system_data',
+                         ('cpu_percent', 'memory_percent', 'disk_percent')),
+    'device_data.json': ('device_data',
+                         ('ip_address', 'is_reachable', 'response_time')),
+    'alert_data.json': ('alert_data',
+                        ('alert_type', 'message', 'severity', 'resolved')),
+}
+
 class DataLogger:
-    """Handles data logging and storage for network monitoring"""
-    
+    """Handles data logging and storage for network monitoring
+
+    Storage is a single SQLite database: inserts are O(log N) via the
+    timestamp index, history windows become indexed range queries, and
+    cleanup is a single DELETE — no whole-file rewrites.
+    """
+
     def __init__(self, data_directory: str = 'data'):
         self.data_directory = data_directory
         self.logger = logging.getLogger(__name__)
-        
+
         # Ensure data directory exists
         os.makedirs(data_directory, exist_ok=True)
-        
-        # Initialize data files
-        self.network_data_file = os.path.join(data_directory, 'network_data.json')
-        self.system_data_file = os.path.join(data_directory, 'system_data.json')
-        self.device_data_file = os.path.join(data_directory, 'device_data.json')
-        self.alert_data_file = os.path.join(data_directory, 'alert_data.json')
-    
-    def _load_data_file(self, filename: str) -> List[Dict]:
-        """Load data from JSON file"""
-        try:
-            if os.path.exists(filename):
-                with open(filename, 'r') as f:
-                    return json.load(f)
-            return []
-        except Exception as e:
-            self.logger.error(f"Error loading data file {filename}: {e}")
-            return []
-    
-    def _save_data_file(self, filename: str, data: List[Dict]) -> bool:
-        """Save data to JSON file"""
-        try:
-            with open(filename, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
-            return True
-        except Exception as e:
-            self.logger.error(f"Error saving data file {filename}: {e}")
-            return False
-    
-    def _cleanup_old_data(self, data: List[Dict], max_records: int = 10000) -> List[Dict]:
-        """Keep only the most recent records"""
-        if len(data) > max_records:
-            # Sort by timestamp and keep the most recent
-            data.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-            return data[:max_records]
-        return data
-    
-    def log_network_data(self, upload_mbps: float, download_mbps: float, 
+
+        self.db_file = os.path.join(data_directory, 'monitoring.db')
+
+        # WAL lets the dashboard read while the monitor writes;
+        # synchronous=NORMAL skips the per-commit fsync (WAL is still
+        # crash-safe, at worst the last few records are lost)
+        self.conn = sqlite3.connect(
+            self.db_file, isolation_level=None, check_same_thread=False
+        )
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(_SCHEMA)
+
+        # Serialize writes: the scheduler threads share this connection
+        self._lock = threading.Lock()
+
+        self._import_legacy_files()
+
+        # One connection for the logger's lifetime — every insert reuses
+        # it instead of paying open/parse-schema/close per call. Close at
+        # exit so the WAL is checkpointed back into the main database.
+        atexit.register(self.close)
+
+    def close(self):
+        """Checkpoint the WAL and close the persistent connection"""
+        with self._lock:
+            if self.conn is not None:
+                try:
+                    self.conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+                    self.conn.close()
+                except sqlite3.Error as e:
+                    self.logger.error(f"Error closing database: {e}")
+                self.conn = None
+
+    @staticmethod
+    def _iter_legacy_records(f):
+        """Yield records from a legacy data file in either historical format
+
+        Early releases wrote pretty-printed JSON arrays; later ones wrote
+        one object per line. Peek at the first byte to tell them apart.
+        """
+        head = f.read(64).lstrip()
+        f.seek(0)
+        if head.startswith(b'['):
+            try:
+                yield from _loads(f.read())
+            except (ValueError, TypeError):
+                return
+        else:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    yield _loads(line)
+                except (ValueError, TypeError):
+                    continue
+
+    def _import_legacy_files(self):
+        """One-time import of old JSON data files into the database"""
+        for basename, (table, columns) in _LEGACY_FILES.items():
+            filename = os.path.join(self.data_directory, basename)
+            try:
+                if not os.path.exists(filename):
+                    continue
+
+                rows = []
+                with open(filename, 'rb') as f:
+                    for record in self._iter_legacy_records(f):
+                        try:
+                            ts = self._record_ts(record)
+                        except (ValueError, TypeError, AttributeError):
+                            continue
+                        rows.append((ts,) + tuple(record.get(c) for c in columns))
+
+                if not rows:
+                    # Leave unparseable files in place rather than renaming
+                    # pre-upgrade history out of every future import attempt
+                    self.logger.warning(
+                        f"No records parsed from legacy file {filename}; leaving it untouched")
+                    continue
+
+                placeholders = ','.join('?' * (len(columns) + 1))
+                cols = ','.join(('timestamp',) + columns)
+                with self._lock:
+                    self.conn.executemany(
+                        f"INSERT INTO {table} ({cols}) VALUES ({placeholders})",
+                        rows
+                    )
+
+                os.replace(filename, filename + '.imported')
+                self.logger.info(f"Imported {len(rows)} records from {filename}")
+            except Exception as e:
+                self.logger.error(f"Error importing legacy file {filename}: {e}")
+
+    @staticmethod
+    def _record_ts(record: Dict) -> float:
+        """Record timestamp as epoch seconds; parses legacy ISO strings"""
+        ts = record.get('timestamp')
+        if isinstance(ts, (int, float)):
+            return ts
+        return datetime.fromisoformat(str(ts)).timestamp()
+
+    def log_network_data(self, upload_mbps: float, download_mbps: float,
                         network_stats, anomalies: List[str] = None) -> bool:
         """Log network monitoring data"""
         try:
-            data = self._load_data_file(self.network_data_file)
-            
-            record = {
-                'timestamp': datetime.now().isoformat(),
-                'upload_mbps': upload_mbps,
-                'download_mbps': download_mbps,
-                'bytes_sent': network_stats.bytes_sent,
-                'bytes_recv': network_stats.bytes_recv,
-                'packets_sent': network_stats.packets_sent,
-                'packets_recv': network_stats.packets_recv,
-                'anomalies': anomalies or []
-            }
-            
-            data.append(record)
-            data = self._cleanup_old_data(data)
-            
-            return self._save_data_file(self.network_data_file, data)
-            
+            with self._lock:
+                self.conn.execute(
+                    "INSERT INTO network_data VALUES (?,?,?,?,?,?,?,?)",
+                    (time.time(), upload_mbps, download_mbps,
+                     network_stats.bytes_sent, network_stats.bytes_recv,
+                     network_stats.packets_sent, network_stats.packets_recv,
+                     _dumps(anomalies) if anomalies else None)
+                )
+            return True
         except Exception as e:
             self.logger.error(f"Error logging network data: {e}")
             return False
-    
+
     def log_system_data(self, system_stats) -> bool:
         """Log system monitoring data"""
         try:
-            data = self._load_data_file(self.system_data_file)
-            
-            record = {
-                'timestamp': system_stats.timestamp.isoformat(),
-                'cpu_percent': system_stats.cpu_percent,
-                'memory_percent': system_stats.memory_percent,
-                'disk_percent': system_stats.disk_percent
-            }
-            
-            data.append(record)
-            data = self._cleanup_old_data(data)
-            
-            return self._save_data_file(self.system_data_file, data)
-            
+            with self._lock:
+                self.conn.execute(
+                    "INSERT INTO system_data VALUES (?,?,?,?)",
+                    (system_stats.timestamp,
+                     system_stats.cpu_percent,
+                     system_stats.memory_percent,
+                     system_stats.disk_percent)
+                )
+            return True
         except Exception as e:
             self.logger.error(f"Error logging system data: {e}")
             return False
-    
+
+    def _insert_batch(self, sql: str, rows: List[tuple]) -> bool:
+        """Gather-write a batch of rows in one transaction
+
+        All rows are serialized up front and committed together, so N
+        records cost one journal write instead of N autocommits — the
+        writev analogue for the database path.
+        """
+        if not rows:
+            return True
+        with self._lock:
+            try:
+                self.conn.execute('BEGIN')
+                self.conn.executemany(sql, rows)
+                self.conn.execute('COMMIT')
+                return True
+            except Exception as e:
+                try:
+                    self.conn.execute('ROLLBACK')
+                except Exception:
+                    pass
+                self.logger.error(f"Error inserting batch: {e}")
+                return False
+
     def log_device_data(self, device_statuses: List) -> bool:
         """Log device monitoring data"""
-        try:
-            data = self._load_data_file(self.device_data_file)
-            
-            for status in device_statuses:
-                record = {
-                    'timestamp': status.timestamp.isoformat(),
-                    'ip_address': status.ip_address,
-                    'is_reachable': status.is_reachable,
-                    'response_time': status.response_time
-                }
-                data.append(record)
-            
-            data = self._cleanup_old_data(data)
-            
-            return self._save_data_file(self.device_data_file, data)
-            
-        except Exception as e:
-            self.logger.error(f"Error logging device data: {e}")
-            return False
-    
+        return self._insert_batch(
+            "INSERT INTO device_data VALUES (?,?,?,?)",
+            [(status.timestamp, status.ip_address,
+              status.is_reachable, status.response_time)
+             for status in device_statuses]
+        )
+
     def log_alert_data(self, alerts: List) -> bool:
         """Log alert data"""
+        return self._insert_batch(
+            "INSERT INTO alert_data VALUES (?,?,?,?,?)",
+            [(alert.timestamp.timestamp(), alert.alert_type,
+              alert.message, alert.severity, alert.resolved)
+             for alert in alerts]
+        )
+
+    @staticmethod
+    def _cutoff(hours: int) -> float:
+        """Epoch cutoff for a lookback window"""
+        return time.time() - hours * 3600
+
+    def _query_history(self, table: str, hours: int,
+                       where: str = '', params: tuple = ()) -> List[Dict]:
+        """Indexed time-range query, returned as a list of dicts"""
         try:
-            data = self._load_data_file(self.alert_data_file)
-            
-            for alert in alerts:
-                record = {
-                    'timestamp': alert.timestamp.isoformat(),
-                    'alert_type': alert.alert_type,
-                    'message': alert.message,
-                    'severity': alert.severity,
-                    'resolved': alert.resolved
-                }
-                data.append(record)
-            
-            data = self._cleanup_old_data(data)
-            
-            return self._save_data_file(self.alert_data_file, data)
-            
+            cursor = self.conn.execute(
+                f"SELECT * FROM {table} WHERE timestamp >= ?{where} "
+                f"ORDER BY timestamp",
+                (self._cutoff(hours),) + params
+            )
+            return [dict(row) for row in cursor]
         except Exception as e:
-            self.logger.error(f"Error logging alert data: {e}")
-            return False
-    
+            self.logger.error(f"Error querying {table}: {e}")
+            return []
+
     def get_network_history(self, hours: int = 24) -> List[Dict]:
         """Get network data history for specified hours"""
+        records = self._query_history('network_data', hours)
+        for record in records:
+            record['anomalies'] = _loads(record['anomalies']) if record['anomalies'] else []
+        return records
+
+    def _query_since(self, table: str, since: float) -> List[Dict]:
+        """Rows strictly newer than `since` — feeds the dashboard's push streams"""
         try:
-            data = self._load_data_file(self.network_data_file)
-            
-            # Filter data for the specified time period
-            cutoff_time = datetime.now().timestamp() - (hours * 3600)
-            
-            filtered_data = []
-            for record in data:
-                try:
-                    record_time = datetime.fromisoformat(record['timestamp']).timestamp()
-                    if record_time >= cutoff_time:
-                        filtered_data.append(record)
-                except:
-                    continue
-            
-            return filtered_data
-            
+            cursor = self.conn.execute(
+                f"SELECT * FROM {table} WHERE timestamp > ? ORDER BY timestamp",
+                (since,)
+            )
+            return [dict(row) for row in cursor]
         except Exception as e:
-            self.logger.error(f"Error getting network history: {e}")
+            self.logger.error(f"Error querying {table} since {since}: {e}")
             return []
-    
+
+    def get_network_updates(self, since: float) -> List[Dict]:
+        """Network rows newer than the given epoch timestamp"""
+        records = self._query_since('network_data', since)
+        for record in records:
+            record['anomalies'] = _loads(record['anomalies']) if record['anomalies'] else []
+        return records
+
+    def get_system_updates(self, since: float) -> List[Dict]:
+        """System rows newer than the given epoch timestamp"""
+        return self._query_since('system_data', since)
+
     def get_system_history(self, hours: int = 24) -> List[Dict]:
         """Get system data history for specified hours"""
-        try:
-            data = self._load_data_file(self.system_data_file)
-            
-            # Filter data for the specified time period
-            cutoff_time = datetime.now().timestamp() - (hours * 3600)
-            
-            filtered_data = []
-            for record in data:
-                try:
-                    record_time = datetime.fromisoformat(record['timestamp']).timestamp()
-                    if record_time >= cutoff_time:
-                        filtered_data.append(record)
-                except:
-                    continue
-            
-            return filtered_data
-            
-        except Exception as e:
-            self.logger.error(f"Error getting system history: {e}")
-            return []
-    
+        return self._query_history('system_data', hours)
+
     def get_device_history(self, ip_address: str = None, hours: int = 24) -> List[Dict]:
         """Get device data history for specified device and time period"""
-        try:
-            data = self._load_data_file(self.device_data_file)
-            
-            # Filter data for the specified time period
-            cutoff_time = datetime.now().timestamp() - (hours * 3600)
-            
-            filtered_data = []
-            for record in data:
-                try:
-                    record_time = datetime.fromisoformat(record['timestamp']).timestamp()
-                    if record_time >= cutoff_time:
-                        if ip_address is None or record.get('ip_address') == ip_address:
-                            filtered_data.append(record)
-                except:
-                    continue
-            
-            return filtered_data
-            
-        except Exception as e:
-            self.logger.error(f"Error getting device history: {e}")
-            return []
-    
+        if ip_address is not None:
+            records = self._query_history('device_data', hours,
+                                          ' AND ip_address = ?', (ip_address,))
+        else:
+            records = self._query_history('device_data', hours)
+        for record in records:
+            record['is_reachable'] = bool(record['is_reachable'])
+        return records
+
     def get_alert_history(self, hours: int = 24) -> List[Dict]:
         """Get alert history for specified hours"""
+        records = self._query_history('alert_data', hours)
+        for record in records:
+            record['resolved'] = bool(record['resolved'])
+        return records
+
+    def _load_history_df(self, table: str, hours: int, columns: List[str] = None,
+                         where: str = '', params: tuple = ()):
+        """Load a history window as a DataFrame with parsed timestamps
+
+        When `columns` is given, the SELECT only projects those columns
+        so chart consumers do not pay for fields they never read.
+        """
+        # Imported lazily so the core logger stays pandas-free for the monitor
+        import pandas as pd
+
         try:
-            data = self._load_data_file(self.alert_data_file)
-            
-            # Filter data for the specified time period
-            cutoff_time = datetime.now().timestamp() - (hours * 3600)
-            
-            filtered_data = []
-            for record in data:
-                try:
-                    record_time = datetime.fromisoformat(record['timestamp']).timestamp()
-                    if record_time >= cutoff_time:
-                        filtered_data.append(record)
-                except:
-                    continue
-            
-            return filtered_data
-            
+            cols = '*'
+            if columns is not None:
+                cols = ', '.join(columns)
+                if 'timestamp' not in columns:
+                    cols = 'timestamp, ' + cols
+
+            df = pd.read_sql_query(
+                f"SELECT {cols} FROM {table} WHERE timestamp >= ?{where} "
+                f"ORDER BY timestamp",
+                self.conn, params=(self._cutoff(hours),) + params
+            )
+
+            if df.empty:
+                return df
+
+            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='s')
+
+            dtypes = {col: dtype for col, dtype in HISTORY_DTYPES.items() if col in df.columns}
+            return df.astype(dtypes) if dtypes else df
+
         except Exception as e:
-            self.logger.error(f"Error getting alert history: {e}")
-            return []
-    
-    def export_data(self, filename: str, data_type: str = 'all', hours: int = 24) -> bool:
-        """Export data to a file"""
+            self.logger.error(f"Error loading history DataFrame from {table}: {e}")
+            return pd.DataFrame()
+
+    def get_network_history_df(self, hours: int = 24, columns: List[str] = None):
+        """Get network history as a DataFrame, filtered in the query layer"""
+        return self._load_history_df('network_data', hours, columns)
+
+    def get_system_history_df(self, hours: int = 24, columns: List[str] = None):
+        """Get system history as a DataFrame, filtered in the query layer"""
+        return self._load_history_df('system_data', hours, columns)
+
+    def get_device_history_df(self, ip_address: str = None, hours: int = 24,
+                              columns: List[str] = None):
+        """Get device history as a DataFrame, optionally for a single device"""
+        if ip_address is not None:
+            return self._load_history_df('device_data', hours, columns,
+                                         ' AND ip_address = ?', (ip_address,))
+        return self._load_history_df('device_data', hours, columns)
+
+    def get_alert_history_df(self, hours: int = 24, columns: List[str] = None):
+        """Get alert history as a DataFrame, filtered in the query layer"""
+        return self._load_history_df('alert_data', hours, columns)
+
+    @staticmethod
+    def _export_view(records: List[Dict]) -> List[Dict]:
+        """Copy records with epoch timestamps rendered as ISO for export"""
+        view = []
+        for record in records:
+            ts = record.get('timestamp')
+            if isinstance(ts, (int, float)):
+                record = dict(record)
+                record['timestamp'] = datetime.fromtimestamp(ts).isoformat()
+            view.append(record)
+        return view
+
+    def _export_parquet(self, filename: str, datasets: Dict[str, List[Dict]]) -> bool:
+        """Write one Parquet file per data kind
+
+        Columnar layout with dictionary encoding of repeated strings
+        (ip_address, alert_type) and zstd compression typically shrinks
+        these records 5-10x versus pretty-printed JSON, and the output
+        loads natively into pandas/DuckDB.
+        """
+        # Imported lazily: pyarrow is only needed for Parquet exports
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        base, ext = os.path.splitext(filename)
+        single = len(datasets) == 1
+
+        for kind, records in datasets.items():
+            if not records:
+                continue
+
+            table = pa.Table.from_pylist(records)
+            # Narrow metric columns to float32, matching HISTORY_DTYPES;
+            # counters stay at pyarrow's inferred int64
+            fields = [
+                pa.field(f.name, pa.float32())
+                if HISTORY_DTYPES.get(f.name) == 'float32' else f
+                for f in table.schema
+            ]
+            table = table.cast(pa.schema(fields))
+
+            path = filename if single else f"{base}_{kind}{ext or '.parquet'}"
+            pq.write_table(table, path, compression='zstd', use_dictionary=True)
+            self.logger.info(f"Exported {table.num_rows} {kind} records to {path}")
+
+        return True
+
+    def export_data(self, filename: str, data_type: str = 'all', hours: int = 24,
+                    format: str = 'json') -> bool:
+        """Export data to a file (JSON by default, or Parquet per kind)"""
         try:
-            export_data = {}
-            
+            datasets = {}
+
             if data_type in ['all', 'network']:
-                export_data['network'] = self.get_network_history(hours)
-            
+                datasets['network'] = self.get_network_history(hours)
+
             if data_type in ['all', 'system']:
-                export_data['system'] = self.get_system_history(hours)
-            
+                datasets['system'] = self.get_system_history(hours)
+
             if data_type in ['all', 'device']:
-                export_data['device'] = self.get_device_history(hours=hours)
-            
+                datasets['device'] = self.get_device_history(hours=hours)
+
             if data_type in ['all', 'alert']:
-                export_data['alert'] = self.get_alert_history(hours)
-            
+                datasets['alert'] = self.get_alert_history(hours)
+
+            if format == 'parquet':
+                return self._export_parquet(filename, datasets)
+
+            export_data = {
+                kind: self._export_view(records)
+                for kind, records in datasets.items()
+            }
             export_data['export_timestamp'] = datetime.now().isoformat()
             export_data['export_period_hours'] = hours
-            
+
             with open(filename, 'w') as f:
                 json.dump(export_data, f, indent=2)
-            
+
             self.logger.info(f"Data exported to {filename}")
             return True
-            
+
+        except ImportError:
+            self.logger.error("Parquet export requires pyarrow (pip install pyarrow)")
+            return False
         except Exception as e:
             self.logger.error(f"Error exporting data: {e}")
             return False
+
+    _EXPORT_TABLES = {
+        'network': 'network_data',
+        'system': 'system_data',
+        'device': 'device_data',
+        'alert': 'alert_data',
+    }
+
+    def export_data_stream(self, filename: str, data_type: str = 'all',
+                           hours: int = 24) -> bool:
+        """Stream an export as JSON Lines with constant memory
+
+        Rows flow straight from the query cursor to the output file one
+        line at a time — peak memory stays flat no matter how large the
+        window is, unlike export_data which materializes every record
+        first. Each line carries a 'kind' field naming its data type.
+        """
+        try:
+            cutoff = self._cutoff(hours)
+
+            with open(filename, 'w') as f:
+                for kind, table in self._EXPORT_TABLES.items():
+                    if data_type not in ('all', kind):
+                        continue
+
+                    cursor = self.conn.execute(
+                        f"SELECT * FROM {table} WHERE timestamp >= ? "
+                        f"ORDER BY timestamp",
+                        (cutoff,)
+                    )
+                    for row in cursor:
+                        record = dict(row)
+                        record['kind'] = kind
+                        ts = record.get('timestamp')
+                        if isinstance(ts, (int, float)):
+                            record['timestamp'] = datetime.fromtimestamp(ts).isoformat()
+                        f.write(_dumps(record) + "\n")
+
+            self.logger.info(f"Data streamed to {filename}")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Error streaming export: {e}")
+            return False
+
+    def cleanup_old_data(self, days: int = 30) -> bool:
+        """Delete records older than the retention window"""
+        try:
+            cutoff = time.time() - days * 86400
+            with self._lock:
+                for table in ('network_data', 'system_data',
+                              'device_data', 'alert_data'):
+                    self.conn.execute(
+                        f"DELETE FROM {table} WHERE timestamp < ?", (cutoff,)
+                    )
+            self.logger.info(f"Cleaned up data older than {days} days")
+            return True
+        except Exception as e:
+            self.logger.error(f"Error cleaning up old data: {e}")
+            return False
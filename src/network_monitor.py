@@ -1,12 +1,31 @@
+import asyncio
+import numpy as np
 import psutil
 import subprocess
 import platform
 import time
 import logging
-from datetime import datetime
+from collections import deque
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
+# Optional: icmplib sends ICMP from this process (datagram sockets when
+# unprivileged), skipping the fork/exec of the ping binary per probe
+try:
+    import icmplib
+except ImportError:
+    icmplib = None
+
+# Ping command prefix resolved once at import — the OS does not change
+# between calls
+_IS_WINDOWS = platform.system().lower() == "windows"
+_PING_PREFIX = ("ping", "-n", "1", "-w") if _IS_WINDOWS else ("ping", "-c", "1", "-W")
+
+def _ping_cmd(ip_address: str, timeout: int) -> tuple:
+    """Full ping argv for one probe (Windows wants milliseconds)"""
+    wait = str(timeout * 1000) if _IS_WINDOWS else str(timeout)
+    return _PING_PREFIX + (wait, ip_address)
+
 @dataclass
 class NetworkStats:
     """Data class for network statistics"""
@@ -14,7 +33,7 @@ class NetworkStats:
     bytes_recv: int
     packets_sent: int
     packets_recv: int
-    timestamp: datetime
+    timestamp: float  # epoch seconds
     interface: str = "total"
 
 @dataclass
@@ -24,7 +43,7 @@ class SystemStats:
     memory_percent: float
     disk_percent: float
     network_io: NetworkStats
-    timestamp: datetime
+    timestamp: float  # epoch seconds
 
 @dataclass
 class DeviceStatus:
@@ -32,7 +51,7 @@ class DeviceStatus:
     ip_address: str
     is_reachable: bool
     response_time: Optional[float]
-    timestamp: datetime
+    timestamp: float  # epoch seconds
 
 class NetworkMonitor:
     """Core network monitoring functionality"""
@@ -40,19 +59,60 @@ class NetworkMonitor:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.previous_network_io = None
-        self.bandwidth_history = []
+
+        # Bandwidth history as three parallel arrays used as a ring —
+        # structure-of-arrays instead of 100 per-sample dicts: ~2.4KB of
+        # contiguous floats, and window math vectorizes in NumPy
+        self._bw_ts = np.zeros(100)
+        self._bw_up = np.zeros(100)
+        self._bw_down = np.zeros(100)
+        self._bw_idx = 0
+        self._bw_count = 0
+
+        # 10-point windows with paired running sums so the moving
+        # average in detect_anomalies is O(1) instead of re-summing
+        # the history slice on every tick
+        self._upload_window = deque(maxlen=10)
+        self._download_window = deque(maxlen=10)
+        self._upload_sum = 0.0
+        self._download_sum = 0.0
+
+        # Short-TTL caches for psutil reads: counters answer repeat
+        # calls within the same polling tick without re-reading
+        # /proc/net/dev; memory/disk are slow-changing so a 1s TTL is
+        # plenty
+        self._io_cache = (float('-inf'), None)
+        self._mem_cache = (float('-inf'), None)
+        self._disk_cache = (float('-inf'), None)
+
+        # Cleared on the first ICMP permission failure so every later
+        # sweep goes straight to the subprocess path instead of
+        # re-raising (and re-logging) once per tick
+        self._icmp_batch_ok = icmplib is not None
+
+        # Prime psutil's internal CPU-time snapshot so later
+        # cpu_percent(interval=None) calls return the delta since the
+        # previous call instead of blocking for a sampling window
+        psutil.cpu_percent(interval=None)
         
     def get_network_stats(self) -> NetworkStats:
         """Get current network I/O statistics"""
         try:
+            now = time.monotonic()
+            cached_at, cached = self._io_cache
+            if now - cached_at < 0.05:
+                return cached
+
             io_counters = psutil.net_io_counters()
-            return NetworkStats(
+            stats = NetworkStats(
                 bytes_sent=io_counters.bytes_sent,
                 bytes_recv=io_counters.bytes_recv,
                 packets_sent=io_counters.packets_sent,
                 packets_recv=io_counters.packets_recv,
-                timestamp=datetime.now()
+                timestamp=time.time()
             )
+            self._io_cache = (now, stats)
+            return stats
         except Exception as e:
             self.logger.error(f"Error getting network stats: {e}")
             raise
@@ -64,7 +124,7 @@ class NetworkMonitor:
             return 0.0, 0.0
         
         # Calculate time difference
-        time_diff = (current_stats.timestamp - self.previous_network_io.timestamp).total_seconds()
+        time_diff = current_stats.timestamp - self.previous_network_io.timestamp
         
         if time_diff <= 0:
             return 0.0, 0.0
@@ -80,29 +140,77 @@ class NetworkMonitor:
         # Update previous stats
         self.previous_network_io = current_stats
         
-        # Store in history (keep last 100 measurements)
-        self.bandwidth_history.append({
-            'timestamp': current_stats.timestamp,
-            'upload_mbps': upload_mbps,
-            'download_mbps': download_mbps
-        })
-        
-        if len(self.bandwidth_history) > 100:
-            self.bandwidth_history.pop(0)
-        
+        # Store in the ring: the write index wraps, overwriting the
+        # oldest of 100 samples
+        idx = self._bw_idx
+        self._bw_ts[idx] = current_stats.timestamp
+        self._bw_up[idx] = upload_mbps
+        self._bw_down[idx] = download_mbps
+        self._bw_idx = (idx + 1) % 100
+        if self._bw_count < 100:
+            self._bw_count += 1
+
+        # Maintain the running sums: subtract the value about to fall
+        # out of each full window, then add the new one
+        if len(self._upload_window) == 10:
+            self._upload_sum -= self._upload_window[0]
+            self._download_sum -= self._download_window[0]
+        self._upload_window.append(upload_mbps)
+        self._download_window.append(download_mbps)
+        self._upload_sum += upload_mbps
+        self._download_sum += download_mbps
+
         return upload_mbps, download_mbps
-    
+
+    @property
+    def bandwidth_history(self) -> List[Dict]:
+        """Bandwidth samples in chronological order (built on demand)"""
+        if self._bw_count < 100:
+            order = range(self._bw_count)
+        else:
+            order = [(self._bw_idx + i) % 100 for i in range(100)]
+        return [
+            {
+                'timestamp': self._bw_ts[i],
+                'upload_mbps': self._bw_up[i],
+                'download_mbps': self._bw_down[i]
+            }
+            for i in order
+        ]
+
+    def _memory_percent(self) -> float:
+        """virtual_memory().percent behind a 1-second TTL cache"""
+        now = time.monotonic()
+        cached_at, cached = self._mem_cache
+        if now - cached_at < 1.0:
+            return cached
+        value = psutil.virtual_memory().percent
+        self._mem_cache = (now, value)
+        return value
+
+    def _disk_percent(self) -> float:
+        """disk_usage('/').percent behind a 1-second TTL cache"""
+        now = time.monotonic()
+        cached_at, cached = self._disk_cache
+        if now - cached_at < 1.0:
+            return cached
+        value = psutil.disk_usage('/').percent
+        self._disk_cache = (now, value)
+        return value
+
     def get_system_stats(self) -> SystemStats:
         """Get comprehensive system statistics"""
         try:
             network_stats = self.get_network_stats()
-            
+
+            # interval=None reads the usage delta accumulated since the last
+            # call — free for periodic callers, no 1-second blocking sleep
             return SystemStats(
-                cpu_percent=psutil.cpu_percent(interval=1),
-                memory_percent=psutil.virtual_memory().percent,
-                disk_percent=psutil.disk_usage('/').percent,
+                cpu_percent=psutil.cpu_percent(interval=None),
+                memory_percent=self._memory_percent(),
+                disk_percent=self._disk_percent(),
                 network_io=network_stats,
-                timestamp=datetime.now()
+                timestamp=time.time()
             )
         except Exception as e:
             self.logger.error(f"Error getting system stats: {e}")
@@ -110,15 +218,32 @@ class NetworkMonitor:
     
     def ping_device(self, ip_address: str, timeout: int = 5) -> DeviceStatus:
         """Ping a device to check reachability"""
+        if icmplib is not None:
+            try:
+                host = icmplib.ping(
+                    ip_address, count=1, timeout=timeout, privileged=False
+                )
+                return DeviceStatus(
+                    ip_address=ip_address,
+                    is_reachable=host.is_alive,
+                    response_time=host.avg_rtt if host.is_alive else None,
+                    timestamp=time.time()
+                )
+            except Exception as e:
+                self.logger.debug(
+                    f"icmplib ping failed for {ip_address}, "
+                    f"falling back to subprocess: {e}"
+                )
+
         try:
-            # Determine ping command based on OS
-            if platform.system().lower() == "windows":
-                cmd = ["ping", "-n", "1", "-w", str(timeout * 1000), ip_address]
-            else:
-                cmd = ["ping", "-c", "1", "-W", str(timeout), ip_address]
-            
             start_time = time.time()
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout + 2)
+            # Only the exit code matters; DEVNULL skips the pipe setup
+            # and the text-mode decode of output nobody reads
+            result = subprocess.run(
+                _ping_cmd(ip_address, timeout),
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                timeout=timeout + 2
+            )
             response_time = (time.time() - start_time) * 1000  # Convert to milliseconds
             
             is_reachable = result.returncode == 0
@@ -127,7 +252,7 @@ class NetworkMonitor:
                 ip_address=ip_address,
                 is_reachable=is_reachable,
                 response_time=response_time if is_reachable else None,
-                timestamp=datetime.now()
+                timestamp=time.time()
             )
             
         except subprocess.TimeoutExpired:
@@ -136,7 +261,7 @@ class NetworkMonitor:
                 ip_address=ip_address,
                 is_reachable=False,
                 response_time=None,
-                timestamp=datetime.now()
+                timestamp=time.time()
             )
         except Exception as e:
             self.logger.error(f"Error pinging {ip_address}: {e}")
@@ -144,9 +269,104 @@ class NetworkMonitor:
                 ip_address=ip_address,
                 is_reachable=False,
                 response_time=None,
-                timestamp=datetime.now()
+                timestamp=time.time()
             )
     
+    def ping_devices(self, ip_addresses: List[str], timeout: int = 5) -> List[DeviceStatus]:
+        """Probe many devices in one batched ICMP sweep
+
+        icmplib's multiping sends every probe from this process and
+        waits on them concurrently, so N devices cost roughly one
+        round-trip instead of N sequential ping subprocesses.
+        """
+        ips = list(ip_addresses)
+
+        if self._icmp_batch_ok and ips:
+            try:
+                hosts = icmplib.multiping(
+                    ips,
+                    count=1,
+                    timeout=timeout,
+                    privileged=False,
+                    concurrent_tasks=max(1, len(ips))
+                )
+                now = time.time()
+                return [
+                    DeviceStatus(
+                        ip_address=host.address,
+                        is_reachable=host.is_alive,
+                        response_time=host.avg_rtt if host.is_alive else None,
+                        timestamp=now
+                    )
+                    for host in hosts
+                ]
+            except Exception as e:
+                # Unprivileged ICMP sockets are commonly blocked
+                # (ping_group_range unset); that won't change mid-run,
+                # so remember the failure instead of retrying and
+                # warning on every device tick
+                if isinstance(e, getattr(icmplib, 'SocketPermissionError', ())):
+                    self._icmp_batch_ok = False
+                self.logger.debug(
+                    f"Batch ICMP ping failed, using subprocess pings: {e}")
+
+        if not ips:
+            return []
+
+        try:
+            # Launch every ping subprocess at once and await them
+            # together — N hosts cost one timeout, not N stacked ones
+            return asyncio.run(self._ping_subprocesses(ips, timeout))
+        except Exception as e:
+            self.logger.warning(f"Async subprocess pings failed, going sequential: {e}")
+            return [self.ping_device(ip, timeout) for ip in ips]
+
+    async def _ping_subprocesses(self, ips: List[str], timeout: int) -> List[DeviceStatus]:
+        """Run all ping subprocesses concurrently on one event loop"""
+        return list(await asyncio.gather(
+            *(self._ping_subprocess_async(ip, timeout) for ip in ips)
+        ))
+
+    async def _ping_subprocess_async(self, ip_address: str, timeout: int) -> DeviceStatus:
+        """One non-blocking ping subprocess; output is discarded"""
+        try:
+            start_time = time.time()
+            proc = await asyncio.create_subprocess_exec(
+                *_ping_cmd(ip_address, timeout),
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            try:
+                returncode = await asyncio.wait_for(proc.wait(), timeout + 2)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                self.logger.warning(f"Ping timeout for {ip_address}")
+                return DeviceStatus(
+                    ip_address=ip_address,
+                    is_reachable=False,
+                    response_time=None,
+                    timestamp=time.time()
+                )
+
+            response_time = (time.time() - start_time) * 1000
+            is_reachable = returncode == 0
+
+            return DeviceStatus(
+                ip_address=ip_address,
+                is_reachable=is_reachable,
+                response_time=response_time if is_reachable else None,
+                timestamp=time.time()
+            )
+        except Exception as e:
+            self.logger.error(f"Error pinging {ip_address}: {e}")
+            return DeviceStatus(
+                ip_address=ip_address,
+                is_reachable=False,
+                response_time=None,
+                timestamp=time.time()
+            )
+
     def get_network_interfaces(self) -> Dict[str, Dict]:
         """Get network interface information"""
         try:
@@ -185,10 +405,12 @@ class NetworkMonitor:
         if download_mbps > threshold:
             anomalies.append(f"High download traffic: {download_mbps:.2f} Mbps (threshold: {threshold} Mbps)")
         
-        # Check for sudden spikes (if we have enough history)
-        if len(self.bandwidth_history) >= 10:
-            recent_avg_upload = sum(h['upload_mbps'] for h in self.bandwidth_history[-10:]) / 10
-            recent_avg_download = sum(h['download_mbps'] for h in self.bandwidth_history[-10:]) / 10
+        # Check for sudden spikes (if we have enough history); the
+        # averages come straight from the running sums — no per-call
+        # loop over the history
+        if len(self._upload_window) == 10:
+            recent_avg_upload = self._upload_sum / 10
+            recent_avg_download = self._download_sum / 10
             
             # If current usage is 3x the recent average, flag as anomaly
             if upload_mbps > recent_avg_upload * 3 and upload_mbps > 10:  # Minimum 10 Mbps to avoid false positives
@@ -1,47 +1,206 @@
 import logging
-from scapy.all import sniff, IP, TCP, UDP
-from collections import defaultdict
-from datetime import datetime, timedelta
+import socket
+import struct
+import time
+from collections import Counter, defaultdict, deque
+from datetime import datetime
 from typing import Dict, List, Optional
 import threading
 
+# Scapy is only the fallback dissector now; the fast path reads fixed
+# struct offsets straight off a raw AF_PACKET socket
+try:
+    from scapy.all import sniff, IP, TCP, UDP
+except ImportError:
+    sniff = IP = TCP = UDP = None
+
+_ETH_P_IP = 0x0800   # IPv4 over Ethernet
+_ETH_HLEN = 14       # Ethernet header length
+_INET_NTOA = socket.inet_ntoa
+_UNPACK_DPORT = struct.Struct('>H').unpack_from
+
+# IP protocol number -> stats bucket: one indexed load instead of an
+# if/elif/else chain per packet
+_PROTO_TABLE = ['Other'] * 256
+_PROTO_TABLE[6] = 'TCP'
+_PROTO_TABLE[17] = 'UDP'
+_PROTO_TABLE = tuple(_PROTO_TABLE)
+
 class PacketAnalyzer:
     """Advanced packet analysis using Scapy"""
     
     def __init__(self, interface: str = None):
         self.logger = logging.getLogger(__name__)
         self.interface = interface
-        self.packet_stats = defaultdict(int)
+        # Dedicated counters keyed by the raw IP string — no per-packet
+        # f-string keys, no shared table mixing totals with addresses
+        self.total_packets = 0
+        self.src_counts = Counter()
+        self.dst_counts = Counter()
         self.protocol_stats = defaultdict(int)
         self.traffic_by_port = defaultdict(int)
-        self.suspicious_activities = []
+        # Ring buffer: long captures evict the oldest events instead of
+        # growing without bound
+        self.suspicious_activities = deque(maxlen=1024)
+        # Sliding 5-minute window of (timestamp, port) SYNs per source,
+        # so scan detection is O(window) instead of rescanning the whole
+        # suspicious_activities list on every SYN
+        self.scan_window = defaultdict(deque)
         self.capture_thread = None
         self.is_capturing = False
         
+    def _open_raw_socket(self):
+        """Open an AF_PACKET socket for the IPv4 fast path, or None"""
+        try:
+            # Binding the socket to ETH_P_IP is itself the kernel-side
+            # filter: non-IPv4 frames (ARP, STP, IPv6) never cross into
+            # userspace
+            sock = socket.socket(
+                socket.AF_PACKET, socket.SOCK_RAW, socket.htons(_ETH_P_IP)
+            )
+            if self.interface:
+                sock.bind((self.interface, 0))
+            return sock
+        except (AttributeError, OSError) as e:
+            # AF_PACKET is Linux-only and needs CAP_NET_RAW
+            self.logger.debug(f"Raw socket unavailable, using scapy: {e}")
+            return None
+
     def start_capture(self, duration: int = 60):
         """Start packet capture for specified duration"""
         if self.is_capturing:
             self.logger.warning("Packet capture already running")
             return
-        
+
+        sock = self._open_raw_socket()
+        if sock is None and sniff is None:
+            self.logger.error("No capture backend available (raw socket or scapy)")
+            return
+
         self.is_capturing = True
         self.logger.info(f"Starting packet capture for {duration} seconds")
-        
+
         def capture_packets():
             try:
-                sniff(
-                    iface=self.interface,
-                    prn=self._process_packet,
-                    timeout=duration,
-                    store=False
-                )
+                if sock is not None:
+                    self._capture_raw(sock, duration)
+                else:
+                    # BPF filter compiled by libpcap: only IP packets
+                    # are copied across the kernel boundary, everything
+                    # else is dropped before Python sees it
+                    sniff(
+                        iface=self.interface,
+                        prn=self._process_packet,
+                        filter="ip",
+                        timeout=duration,
+                        store=False
+                    )
             except Exception as e:
                 self.logger.error(f"Error during packet capture: {e}")
             finally:
+                if sock is not None:
+                    sock.close()
                 self.is_capturing = False
-        
+
         self.capture_thread = threading.Thread(target=capture_packets, daemon=True)
         self.capture_thread.start()
+
+    def _capture_raw(self, sock, duration: int):
+        """Receive loop for the AF_PACKET fast path
+
+        Fields are read at fixed struct offsets — no per-layer protocol
+        dissection — which sustains an order of magnitude more packets
+        per second than scapy's Python dissectors.
+        """
+        sock.settimeout(1.0)
+        deadline = time.monotonic() + duration
+        recvfrom = sock.recvfrom
+
+        while self.is_capturing and time.monotonic() < deadline:
+            # Block for the first frame, then drain the burst that
+            # arrived behind it without blocking again
+            try:
+                buf, _ = recvfrom(65535)
+            except socket.timeout:
+                continue
+
+            frames = [buf]
+            sock.setblocking(False)
+            try:
+                while len(frames) < 256:
+                    buf, _ = recvfrom(65535)
+                    frames.append(buf)
+            except (BlockingIOError, socket.timeout):
+                pass
+            finally:
+                sock.settimeout(1.0)
+
+            self._process_raw_batch(frames)
+
+    def _process_raw_batch(self, frames: List[bytes]):
+        """Decode a burst of frames with all hot lookups hoisted
+
+        The per-packet costs left after the struct fast path are
+        CPython attribute and global lookups; binding them to locals
+        once per burst removes them from the inner loop entirely.
+        """
+        src_counts = self.src_counts
+        dst_counts = self.dst_counts
+        protocol_stats = self.protocol_stats
+        traffic_by_port = self.traffic_by_port
+        suspicious = self.suspicious_activities
+        check_port_scan = self._check_port_scan
+        ntoa = _INET_NTOA
+        unpack_dport = _UNPACK_DPORT
+        proto_table = _PROTO_TABLE
+
+        count = 0
+        for buf in frames:
+            if len(buf) < _ETH_HLEN + 20:
+                continue
+
+            ihl = (buf[_ETH_HLEN] & 0x0F) * 4
+            proto = buf[_ETH_HLEN + 9]
+            src_ip = ntoa(buf[_ETH_HLEN + 12:_ETH_HLEN + 16])
+            dst_ip = ntoa(buf[_ETH_HLEN + 16:_ETH_HLEN + 20])
+
+            count += 1
+            src_counts[src_ip] += 1
+            dst_counts[dst_ip] += 1
+
+            l4_offset = _ETH_HLEN + ihl
+
+            # Classification is a table load, not a branch chain
+            protocol_stats[proto_table[proto]] += 1
+
+            try:
+                if proto == 6:  # TCP
+                    dport = unpack_dport(buf, l4_offset + 2)[0]
+                    traffic_by_port[dport] += 1
+
+                    if buf[l4_offset + 13] == 0x02:  # pure SYN
+                        check_port_scan(src_ip, dst_ip, dport)
+
+                elif proto == 17:  # UDP
+                    traffic_by_port[unpack_dport(buf, l4_offset + 2)[0]] += 1
+            except (IndexError, struct.error):
+                continue  # truncated frame
+
+            if len(buf) - _ETH_HLEN > 1500:
+                suspicious.append({
+                    'type': 'large_packet',
+                    'src_ip': src_ip,
+                    'dst_ip': dst_ip,
+                    'size': len(buf) - _ETH_HLEN,
+                    'timestamp': time.time(),
+                    'severity': 'medium'
+                })
+
+        self.total_packets += count
+
+    def _process_raw_packet(self, buf: bytes):
+        """Decode one raw Ethernet/IPv4 frame from struct offsets"""
+        self._process_raw_batch([buf])
     
     def _process_packet(self, packet):
         """Process individual packets"""
@@ -52,26 +211,23 @@ class PacketAnalyzer:
                 protocol = packet[IP].proto
                 
                 # Update basic stats
-                self.packet_stats['total'] += 1
-                self.packet_stats[f'from_{src_ip}'] += 1
-                self.packet_stats[f'to_{dst_ip}'] += 1
+                self.total_packets += 1
+                self.src_counts[src_ip] += 1
+                self.dst_counts[dst_ip] += 1
                 
-                # Protocol analysis
+                # Protocol analysis (same table as the raw fast path)
+                self.protocol_stats[_PROTO_TABLE[protocol & 0xFF]] += 1
+
                 if TCP in packet:
-                    self.protocol_stats['TCP'] += 1
                     self.traffic_by_port[packet[TCP].dport] += 1
-                    
+
                     # Detect potential port scanning
                     if packet[TCP].flags == 2:  # SYN flag
                         self._check_port_scan(src_ip, dst_ip, packet[TCP].dport)
-                
+
                 elif UDP in packet:
-                    self.protocol_stats['UDP'] += 1
                     self.traffic_by_port[packet[UDP].dport] += 1
-                
-                else:
-                    self.protocol_stats['Other'] += 1
-                
+
                 # Check for suspicious patterns
                 self._check_suspicious_activity(packet)
                 
@@ -80,18 +236,20 @@ class PacketAnalyzer:
     
     def _check_port_scan(self, src_ip: str, dst_ip: str, port: int):
         """Detect potential port scanning activity"""
-        # Simple port scan detection - multiple ports from same source
-        current_time = datetime.now()
-        recent_threshold = current_time - timedelta(minutes=5)
-        
-        # Count recent connections from this source
-        recent_ports = set()
-        for activity in self.suspicious_activities:
-            if (activity.get('type') == 'port_scan' and 
-                activity.get('src_ip') == src_ip and
-                activity.get('timestamp') > recent_threshold):
-                recent_ports.add(activity.get('port'))
-        
+        # Simple port scan detection - multiple ports from same source.
+        # Epoch floats, not datetime objects: one clock read, no
+        # allocation per SYN
+        current_time = time.time()
+        recent_threshold = current_time - 300.0
+
+        # Record this SYN and expire entries older than the window
+        window = self.scan_window[src_ip]
+        window.append((current_time, port))
+        while window and window[0][0] < recent_threshold:
+            window.popleft()
+
+        recent_ports = {p for _, p in window}
+
         if len(recent_ports) > 10:  # More than 10 different ports in 5 minutes
             self.suspicious_activities.append({
                 'type': 'potential_port_scan',
@@ -112,21 +270,26 @@ class PacketAnalyzer:
                     'src_ip': packet[IP].src,
                     'dst_ip': packet[IP].dst,
                     'size': len(packet),
-                    'timestamp': datetime.now(),
+                    'timestamp': time.time(),
                     'severity': 'medium'
                 })
     
     def get_analysis_report(self) -> Dict:
         """Generate comprehensive packet analysis report"""
-        total_packets = self.packet_stats.get('total', 0)
-        
+        total_packets = self.total_packets
+
         report = {
             'capture_status': 'active' if self.is_capturing else 'stopped',
             'total_packets': total_packets,
             'protocol_distribution': dict(self.protocol_stats),
             'top_ports': dict(sorted(self.traffic_by_port.items(), 
                                    key=lambda x: x[1], reverse=True)[:10]),
-            'suspicious_activities': self.suspicious_activities[-50:],  # Last 50 activities
+            # Last 50 activities, floats rendered as ISO only for display
+            'suspicious_activities': [
+                {**activity,
+                 'timestamp': datetime.fromtimestamp(activity['timestamp']).isoformat()}
+                for activity in list(self.suspicious_activities)[-50:]
+            ],
             'analysis_timestamp': datetime.now().isoformat()
         }
         
@@ -141,8 +304,11 @@ class PacketAnalyzer:
     
     def reset_stats(self):
         """Reset all statistics"""
-        self.packet_stats.clear()
+        self.total_packets = 0
+        self.src_counts.clear()
+        self.dst_counts.clear()
         self.protocol_stats.clear()
         self.traffic_by_port.clear()
         self.suspicious_activities.clear()
+        self.scan_window.clear()
         self.logger.info("Packet analysis statistics reset")
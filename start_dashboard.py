@@ -4,6 +4,7 @@ Network Monitoring Dashboard Launcher
 Starts both the monitoring system and the Streamlit dashboard
 """
 
+import argparse
 import subprocess
 import threading
 import time
@@ -19,27 +20,54 @@ class DashboardLauncher:
         self.monitoring_process = None
         self.dashboard_process = None
         self.running = False
-        
+
+        # Set on SIGCHLD so the supervisor sleeps until the kernel
+        # wakes it — no periodic polling of the children
+        self._child_exited = threading.Event()
+
         # Setup signal handlers
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
-    
+        if hasattr(signal, 'SIGCHLD'):
+            signal.signal(signal.SIGCHLD, self._sigchld_handler)
+
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals"""
         print(f"\n📡 Received signal {signum}, shutting down...")
         self.stop()
         sys.exit(0)
+
+    def _sigchld_handler(self, signum, frame):
+        """Wake the supervisor loop when a child exits"""
+        self._child_exited.set()
     
+    # Written by main.py once its scheduler is up; polled here instead
+    # of sleeping a fixed delay before launching the dashboard
+    READY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                              'data', 'monitor.ready')
+
     def start_monitoring_system(self):
         """Start the main monitoring system"""
         try:
             print("🚀 Starting Network Monitoring System...")
+
+            # Drop any stale marker from a previous unclean shutdown so
+            # the readiness poll can't pass before this child is up
+            try:
+                os.remove(self.READY_FILE)
+            except OSError:
+                pass
+            # Nothing ever read the PIPE ends, so once the child had
+            # written ~64KB the kernel pipe filled and its next write
+            # blocked forever; DEVNULL can never exert back-pressure
+            # start_new_session puts the child in its own process group
+            # so stop() can signal the whole tree, not just the leader
             self.monitoring_process = subprocess.Popen(
                 [sys.executable, "main.py", "--dashboard"],
                 cwd=os.path.dirname(__file__),
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True
             )
             print("✅ Monitoring system started")
             return True
@@ -51,16 +79,23 @@ class DashboardLauncher:
         """Start the Streamlit dashboard"""
         try:
             print("🌐 Starting Streamlit Dashboard...")
-            
-            # Wait a moment for monitoring system to initialize
-            time.sleep(3)
-            
+
+            # Wait for the monitoring system's ready marker — typically
+            # a few hundred ms, versus the flat 3s sleep this replaces.
+            # Cap the wait so a crashed monitor can't hang the launcher.
+            for _ in range(100):
+                if os.path.exists(self.READY_FILE):
+                    break
+                if self.monitoring_process and self.monitoring_process.poll() is not None:
+                    break
+                time.sleep(0.05)
+
             self.dashboard_process = subprocess.Popen([
                 sys.executable, "-m", "streamlit", "run", "dashboard.py",
                 "--server.headless", "true",
                 "--server.port", "8501",
                 "--server.address", "0.0.0.0"
-            ], cwd=os.path.dirname(__file__))
+            ], cwd=os.path.dirname(__file__), start_new_session=True)
             
             print("✅ Dashboard started")
             print("🌐 Dashboard URL: http://localhost:8501")
@@ -95,20 +130,23 @@ class DashboardLauncher:
         print("⏹️  Press Ctrl+C to stop both systems")
         print("=" * 50)
         
-        # Monitor processes
+        # Monitor processes: block until SIGCHLD fires instead of waking
+        # every 5 seconds to poll — zero idle wakeups, and a crashed
+        # child is noticed immediately. The long wait timeout is only a
+        # safety net for platforms without SIGCHLD.
         try:
             while self.running:
-                # Check if processes are still running
+                self._child_exited.wait(timeout=60)
+                self._child_exited.clear()
+
                 if self.monitoring_process and self.monitoring_process.poll() is not None:
                     print("⚠️ Monitoring system stopped unexpectedly")
                     break
-                
+
                 if self.dashboard_process and self.dashboard_process.poll() is not None:
                     print("⚠️ Dashboard stopped unexpectedly")
                     break
-                
-                time.sleep(5)
-                
+
         except KeyboardInterrupt:
             print("\n👋 Received keyboard interrupt")
         finally:
@@ -116,40 +154,72 @@ class DashboardLauncher:
         
         return True
     
+    @staticmethod
+    def _signal_group(process, sig):
+        """Send a signal to the child's whole process group"""
+        try:
+            os.killpg(os.getpgid(process.pid), sig)
+        except (ProcessLookupError, OSError):
+            # Group already gone — fall back to the leader only
+            process.send_signal(sig)
+
+    def _stop_one(self, name, process, timeout):
+        """Wait for one already-signalled child, escalating to SIGKILL"""
+        try:
+            process.wait(timeout=timeout)
+            print(f"✅ {name} stopped")
+        except subprocess.TimeoutExpired:
+            self._signal_group(process, signal.SIGKILL)
+            print(f"🔪 {name} force stopped")
+        except Exception as e:
+            print(f"⚠️ Error stopping {name.lower()}: {e}")
+
     def stop(self):
         """Stop both systems"""
         self.running = False
-        
+
         print("\n🛑 Stopping systems...")
-        
-        # Stop dashboard
-        if self.dashboard_process:
-            try:
-                self.dashboard_process.terminate()
-                self.dashboard_process.wait(timeout=5)
-                print("✅ Dashboard stopped")
-            except subprocess.TimeoutExpired:
-                self.dashboard_process.kill()
-                print("🔪 Dashboard force stopped")
-            except Exception as e:
-                print(f"⚠️ Error stopping dashboard: {e}")
-        
-        # Stop monitoring system
-        if self.monitoring_process:
-            try:
-                self.monitoring_process.terminate()
-                self.monitoring_process.wait(timeout=10)
-                print("✅ Monitoring system stopped")
-            except subprocess.TimeoutExpired:
-                self.monitoring_process.kill()
-                print("🔪 Monitoring system force stopped")
-            except Exception as e:
-                print(f"⚠️ Error stopping monitoring system: {e}")
-        
+
+        # Signal the process groups, not just the leaders: Streamlit
+        # forks workers that would otherwise outlive it and keep
+        # port 8501 bound for the next launch
+        children = [
+            ('Dashboard', self.dashboard_process, 5),
+            ('Monitoring system', self.monitoring_process, 10),
+        ]
+        children = [c for c in children if c[1] is not None]
+
+        # SIGTERM both first, then wait in parallel — total shutdown is
+        # the slowest child's grace period instead of the sum of both
+        for _, process, _ in children:
+            self._signal_group(process, signal.SIGTERM)
+
+        waiters = [threading.Thread(target=self._stop_one, args=c)
+                   for c in children]
+        for waiter in waiters:
+            waiter.start()
+        for waiter in waiters:
+            waiter.join()
+
         print("✅ All systems stopped")
 
 def main():
     """Main entry point"""
+    parser = argparse.ArgumentParser(description='Network Monitoring Dashboard Launcher')
+    parser.add_argument('--yes', '-y', action='store_true',
+                        help='Assume "yes" to all prompts (for scripts and services)')
+    args = parser.parse_args()
+
+    # Under systemd/cron there is no terminal: input() would raise or
+    # block forever, so treat a non-tty stdin like --yes
+    assume_yes = args.yes or not sys.stdin.isatty()
+
+    def confirm(prompt, default=False):
+        if assume_yes:
+            return True
+        response = input(prompt)
+        return response.lower() == 'y' if not default else response.lower() != 'n'
+
     # Check if Streamlit is installed
     try:
         import streamlit
@@ -159,23 +229,21 @@ def main():
         print("❌ Missing required dependencies for dashboard")
         print("📦 Install with: pip install -r requirements.txt")
         print(f"   Missing: {e}")
-        
-        response = input("\n❓ Start monitoring system only? (y/N): ")
-        if response.lower() == 'y':
+
+        if confirm("\n❓ Start monitoring system only? (y/N): "):
             print("🚀 Starting monitoring system only...")
             subprocess.run([sys.executable, "main.py"])
         return
-    
+
     # Check if configuration exists
     if not os.path.exists('.env'):
         print("⚠️ Configuration file (.env) not found")
         print("📝 Please copy .env.example to .env and configure your settings")
-        
-        response = input("❓ Continue with default settings? (y/N): ")
-        if response.lower() != 'y':
+
+        if not confirm("❓ Continue with default settings? (y/N): "):
             print("👋 Setup your .env file first, then run again")
             return
-    
+
     # Start the integrated system
     launcher = DashboardLauncher()
     launcher.start()
@@ -5,22 +5,42 @@ Additional tools for network analysis
 """
 
 import argparse
-import json
+import functools
 import sys
-from datetime import datetime, timedelta
-from src.config import Config
-from src.data_logger import DataLogger
-from src.network_monitor import NetworkMonitor
+from collections import Counter
+from datetime import datetime
+
+# The monitoring stack (psutil, numpy, sqlite3, email machinery) costs
+# a few hundred ms to import; each command pulls in only what it needs
+# so `python utils.py --help` stays at stdlib import cost
+
+@functools.lru_cache(maxsize=1)
+def _monitor():
+    """Shared NetworkMonitor (and logging setup), built on first use
+
+    Every command used to run Config.setup_logging() and construct its
+    own NetworkMonitor; memoizing means one psutil priming pass and one
+    set of logging handlers per process however many commands run.
+    """
+    from src.config import Config
+    from src.network_monitor import NetworkMonitor
+
+    Config.setup_logging()
+    return NetworkMonitor()
 
 def export_data(hours=24, output_file=None):
     """Export monitoring data to file"""
+    from src.data_logger import DataLogger
+
     data_logger = DataLogger()
     
     if not output_file:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_file = f"network_data_export_{timestamp}.json"
-    
-    success = data_logger.export_data(output_file, 'all', hours)
+        output_file = f"network_data_export_{timestamp}.jsonl"
+
+    # Stream rows straight to disk — peak memory stays constant even
+    # for very large windows
+    success = data_logger.export_data_stream(output_file, 'all', hours)
     
     if success:
         print(f"✅ Data exported successfully to {output_file}")
@@ -32,28 +52,28 @@ def export_data(hours=24, output_file=None):
 
 def test_connectivity():
     """Test connectivity to monitored devices"""
-    Config.setup_logging()
-    monitor = NetworkMonitor()
-    
+    from src.config import Config
+
+    monitor = _monitor()
+
     print("🔍 Testing connectivity to monitored devices...")
     print("=" * 50)
-    
-    for device_ip in Config.MONITORED_DEVICES:
-        if device_ip.strip():
-            status = monitor.ping_device(device_ip.strip(), Config.PING_TIMEOUT_SECONDS)
-            
-            status_icon = "✅" if status.is_reachable else "❌"
-            response_time = f"{status.response_time:.1f}ms" if status.response_time else "N/A"
-            
-            print(f"{status_icon} {status.ip_address}: {response_time}")
-    
+
+    # One concurrent sweep: total wall time is ~one ping timeout
+    # instead of timeout × device count
+    devices = [ip.strip() for ip in Config.MONITORED_DEVICES if ip.strip()]
+    for status in monitor.ping_devices(devices, Config.PING_TIMEOUT_SECONDS):
+        status_icon = "✅" if status.is_reachable else "❌"
+        response_time = f"{status.response_time:.1f}ms" if status.response_time else "N/A"
+
+        print(f"{status_icon} {status.ip_address}: {response_time}")
+
     print("=" * 50)
 
 def show_network_interfaces():
     """Display network interface information"""
-    Config.setup_logging()
-    monitor = NetworkMonitor()
-    
+    monitor = _monitor()
+
     print("🌐 Network Interface Information")
     print("=" * 50)
     
@@ -78,78 +98,95 @@ def show_network_interfaces():
 
 def show_system_stats():
     """Display current system statistics"""
-    Config.setup_logging()
-    monitor = NetworkMonitor()
-    
+    monitor = _monitor()
+
     print("💻 Current System Statistics")
     print("=" * 50)
     
+    # Bind the format methods once — each f-string re-parses its spec,
+    # while a prebound "{:,}".format is a single C call per value
+    fmt_pct = "{:.1f}%".format
+    fmt_mbps = "{:.2f} Mbps".format
+    fmt_int = "{:,}".format
+
     try:
         stats = monitor.get_system_stats()
         network_stats = monitor.get_network_stats()
         upload_mbps, download_mbps = monitor.calculate_bandwidth_usage(network_stats)
-        
-        print(f"🖥️  CPU Usage: {stats.cpu_percent:.1f}%")
-        print(f"💾 Memory Usage: {stats.memory_percent:.1f}%")
-        print(f"💿 Disk Usage: {stats.disk_percent:.1f}%")
-        print(f"🌐 Upload: {upload_mbps:.2f} Mbps")
-        print(f"🌐 Download: {download_mbps:.2f} Mbps")
-        print(f"📦 Packets Sent: {network_stats.packets_sent:,}")
-        print(f"📦 Packets Received: {network_stats.packets_recv:,}")
-        print(f"📊 Bytes Sent: {network_stats.bytes_sent:,}")
-        print(f"📊 Bytes Received: {network_stats.bytes_recv:,}")
+
+        print("🖥️  CPU Usage:", fmt_pct(stats.cpu_percent))
+        print("💾 Memory Usage:", fmt_pct(stats.memory_percent))
+        print("💿 Disk Usage:", fmt_pct(stats.disk_percent))
+        print("🌐 Upload:", fmt_mbps(upload_mbps))
+        print("🌐 Download:", fmt_mbps(download_mbps))
+        print("📦 Packets Sent:", fmt_int(network_stats.packets_sent))
+        print("📦 Packets Received:", fmt_int(network_stats.packets_recv))
+        print("📊 Bytes Sent:", fmt_int(network_stats.bytes_sent))
+        print("📊 Bytes Received:", fmt_int(network_stats.bytes_recv))
         
     except Exception as e:
         print(f"❌ Error getting system stats: {e}")
 
 def analyze_data(hours=24):
     """Analyze historical monitoring data"""
+    from operator import itemgetter
+
+    import numpy as np
+
+    from src.data_logger import DataLogger
+
     data_logger = DataLogger()
     
     print(f"📈 Data Analysis - Last {hours} Hours")
     print("=" * 50)
     
-    # Network data analysis
+    # Network data analysis (vectorized and single-pass: one structured
+    # fromiter walks the record list once, then mean/max run at C level
+    # on the resulting columns)
     network_data = data_logger.get_network_history(hours)
     if network_data:
-        upload_speeds = [d['upload_mbps'] for d in network_data]
-        download_speeds = [d['download_mbps'] for d in network_data]
-        
-        print(f"🌐 Network Statistics ({len(network_data)} data points):")
-        print(f"   Upload - Avg: {sum(upload_speeds)/len(upload_speeds):.2f} Mbps, "
-              f"Max: {max(upload_speeds):.2f} Mbps")
-        print(f"   Download - Avg: {sum(download_speeds)/len(download_speeds):.2f} Mbps, "
-              f"Max: {max(download_speeds):.2f} Mbps")
-        
-        # Count anomalies
-        anomaly_count = sum(1 for d in network_data if d.get('anomalies'))
-        print(f"   Anomalies detected: {anomaly_count}")
-    
-    # System data analysis
+        count = len(network_data)
+        # itemgetter extracts all fields per record in one C call
+        # instead of a bytecode-level subscript apiece
+        get_net = itemgetter('upload_mbps', 'download_mbps', 'anomalies')
+        net = np.fromiter(
+            ((u, dn, bool(a)) for u, dn, a in map(get_net, network_data)),
+            dtype=[('up', np.float64), ('down', np.float64), ('anomaly', np.bool_)],
+            count=count)
+        upload_speeds = net['up']
+        download_speeds = net['down']
+
+        print(f"🌐 Network Statistics ({count} data points):")
+        print(f"   Upload - Avg: {upload_speeds.mean():.2f} Mbps, "
+              f"Max: {upload_speeds.max():.2f} Mbps")
+        print(f"   Download - Avg: {download_speeds.mean():.2f} Mbps, "
+              f"Max: {download_speeds.max():.2f} Mbps")
+        print(f"   Anomalies detected: {int(net['anomaly'].sum())}")
+
+    # System data analysis (same single-pass extraction)
     system_data = data_logger.get_system_history(hours)
     if system_data:
-        cpu_usage = [d['cpu_percent'] for d in system_data]
-        memory_usage = [d['memory_percent'] for d in system_data]
-        
-        print(f"\n💻 System Statistics ({len(system_data)} data points):")
-        print(f"   CPU - Avg: {sum(cpu_usage)/len(cpu_usage):.1f}%, "
-              f"Max: {max(cpu_usage):.1f}%")
-        print(f"   Memory - Avg: {sum(memory_usage)/len(memory_usage):.1f}%, "
-              f"Max: {max(memory_usage):.1f}%")
+        count = len(system_data)
+        sysm = np.fromiter(
+            map(itemgetter('cpu_percent', 'memory_percent'), system_data),
+            dtype=[('cpu', np.float64), ('mem', np.float64)], count=count)
+        cpu_usage = sysm['cpu']
+        memory_usage = sysm['mem']
+
+        print(f"\n💻 System Statistics ({count} data points):")
+        print(f"   CPU - Avg: {cpu_usage.mean():.1f}%, "
+              f"Max: {cpu_usage.max():.1f}%")
+        print(f"   Memory - Avg: {memory_usage.mean():.1f}%, "
+              f"Max: {memory_usage.max():.1f}%")
     
-    # Alert analysis
+    # Alert analysis: Counter tallies each histogram in one C-level pass
     alert_data = data_logger.get_alert_history(hours)
     if alert_data:
-        alert_types = {}
-        severity_counts = {}
-        
-        for alert in alert_data:
-            alert_type = alert.get('alert_type', 'Unknown')
-            severity = alert.get('severity', 'unknown')
-            
-            alert_types[alert_type] = alert_types.get(alert_type, 0) + 1
-            severity_counts[severity] = severity_counts.get(severity, 0) + 1
-        
+        alert_types = Counter(
+            t or 'Unknown' for t in map(itemgetter('alert_type'), alert_data))
+        severity_counts = Counter(
+            s or 'unknown' for s in map(itemgetter('severity'), alert_data))
+
         print(f"\n🚨 Alert Statistics ({len(alert_data)} alerts):")
         print(f"   By Type:")
         for alert_type, count in sorted(alert_types.items()):
@@ -1,50 +1,100 @@
 #!/usr/bin/env python3
 """
 Simple Web Dashboard for Network Monitoring
-Optional enhancement - requires Flask
+Optional enhancement - requires FastAPI and uvicorn
 """
 
-from flask import Flask, render_template, jsonify
-import json
-from datetime import datetime, timedelta
+import asyncio
+import time
+import orjson
+from fastapi import FastAPI, Response
+from fastapi.responses import FileResponse, StreamingResponse
 from src.data_logger import DataLogger
 from src.config import Config
 
-app = Flask(__name__)
+app = FastAPI(title="Network Monitoring Dashboard")
+
+def _fast_json(data) -> Response:
+    """Serialize with orjson — SIMD number formatting beats the stdlib
+    encoder several times over on these float-heavy history payloads"""
+    return Response(orjson.dumps(data), media_type='application/json')
 data_logger = DataLogger()
 
-@app.route('/')
-def dashboard():
+# Dashboards poll every few seconds, often from several tabs at once;
+# a 2s TTL cache keyed by (endpoint, hours) answers those bursts with
+# one query instead of one per poller
+_CACHE_TTL = 2.0
+_cache = {}
+
+async def _cached_history(key: tuple, fn, *args):
+    """Serve from the TTL cache, or query in a worker thread"""
+    now = time.monotonic()
+    entry = _cache.get(key)
+    if entry is not None and now - entry[0] < _CACHE_TTL:
+        return entry[1]
+
+    data = await asyncio.to_thread(fn, *args)
+    _cache[key] = (time.monotonic(), data)
+    return data
+
+@app.get('/')
+async def dashboard():
     """Main dashboard page"""
-    return render_template('dashboard.html')
+    return FileResponse('templates/dashboard.html')
 
-@app.route('/api/network-stats')
-def network_stats():
+@app.get('/api/network-stats')
+async def network_stats(hours: int = 24):
     """API endpoint for network statistics"""
-    hours = request.args.get('hours', 24, type=int)
-    data = data_logger.get_network_history(hours)
-    return jsonify(data)
+    # DataLogger reads are blocking SQLite calls; to_thread keeps the
+    # event loop free to multiplex other dashboard pollers
+    return _fast_json(await _cached_history(
+        ('network', hours), data_logger.get_network_history, hours))
 
-@app.route('/api/system-stats')
-def system_stats():
+@app.get('/api/system-stats')
+async def system_stats(hours: int = 24):
     """API endpoint for system statistics"""
-    hours = request.args.get('hours', 24, type=int)
-    data = data_logger.get_system_history(hours)
-    return jsonify(data)
+    return _fast_json(await _cached_history(
+        ('system', hours), data_logger.get_system_history, hours))
 
-@app.route('/api/alerts')
-def alerts():
+@app.get('/api/alerts')
+async def alerts(hours: int = 24):
     """API endpoint for alerts"""
-    hours = request.args.get('hours', 24, type=int)
-    data = data_logger.get_alert_history(hours)
-    return jsonify(data)
+    return _fast_json(await _cached_history(
+        ('alerts', hours), data_logger.get_alert_history, hours))
 
-@app.route('/api/devices')
-def devices():
+@app.get('/api/devices')
+async def devices(hours: int = 24):
     """API endpoint for device status"""
-    hours = request.args.get('hours', 24, type=int)
-    data = data_logger.get_device_history(hours=hours)
-    return jsonify(data)
+    return _fast_json(await _cached_history(
+        ('devices', hours), data_logger.get_device_history, None, hours))
+
+def _sse_stream(fetch_updates):
+    """SSE generator: push only rows newer than the last event
+
+    Clients connect once with EventSource instead of re-fetching the
+    whole lookback window every few seconds — each event carries just
+    the seconds of data since the previous one.
+    """
+    async def gen():
+        since = time.time() - 60  # seed with the last minute
+        while True:
+            rows = await asyncio.to_thread(fetch_updates, since)
+            if rows:
+                since = rows[-1]['timestamp']
+                yield b'data: ' + orjson.dumps(rows) + b'\n\n'
+            await asyncio.sleep(1)
+    return StreamingResponse(gen(), media_type='text/event-stream')
+
+@app.get('/api/stream/network')
+async def network_stream():
+    """Server-sent events: network deltas since the last event"""
+    return _sse_stream(data_logger.get_network_updates)
+
+@app.get('/api/stream/system')
+async def system_stream():
+    """Server-sent events: system deltas since the last event"""
+    return _sse_stream(data_logger.get_system_updates)
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    import uvicorn
+    uvicorn.run(app, host='0.0.0.0', port=5000)